@@ -1,47 +1,374 @@
-from flask import Flask, request, jsonify
+from flask import Flask, Request, Response, request, jsonify, g, stream_with_context
 from flask_cors import CORS
 import json
 import os
 from werkzeug.utils import secure_filename
-from groq import Groq
+from groq import Groq, AsyncGroq
+import groq
 from dotenv import load_dotenv
 import re
 import fitz
 import docx2txt
 from datetime import datetime
 from difflib import SequenceMatcher
+from collections import Counter, OrderedDict, deque
+from itertools import chain
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
 import math
+import hashlib
+import multiprocessing
+import threading
+import io
+import tempfile
+import time
+import functools
+import gc
+import asyncio
+import random
+import sqlite3
+import subprocess
+import sys
+import bisect
+import heapq
+from array import array
+import cProfile
+import uuid
+import zipfile
+from contextlib import contextmanager, nullcontext
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 # Load environment variables
 load_dotenv()
 groq_api_key = os.getenv("GROQ_API_KEY")
 
+# Uploads are parsed straight from memory; only files above this size are
+# spooled to a temporary file while the request is read
+UPLOAD_SPOOL_THRESHOLD = int(os.getenv("UPLOAD_SPOOL_THRESHOLD", str(4 * 1024 * 1024)))
+
+class UploadRequest(Request):
+    def _get_file_stream(self, total_content_length, content_type, filename=None, content_length=None):
+        return tempfile.SpooledTemporaryFile(max_size=UPLOAD_SPOOL_THRESHOLD, mode='rb+')
+
 # Initialize Flask app
 app = Flask(__name__)
+app.request_class = UploadRequest
 CORS(app)
-app.config['UPLOAD_FOLDER'] = 'uploads'
 app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max file size
 
-# Ensure upload directory exists
-os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
+# Fuzzy matching mode: "indexed" looks up candidates in a per-resume
+# character index, "compat" scans every resume word like the original matcher
+FUZZY_MATCH_MODE = os.getenv("FUZZY_MATCH_MODE", "indexed")
+
+# Process pool used for batch scoring; 1 worker keeps scoring in-process
+app.config['SCORING_WORKERS'] = int(os.getenv("SCORING_WORKERS", "1"))
+app.config['SCORING_CHUNK_SIZE'] = int(os.getenv("SCORING_CHUNK_SIZE", "16"))
+
+# Bounded-cost scoring. Resume texts are cut at SCORING_MAX_TEXT_CHARS, fuzzy
+# matching looks at no more than SCORING_MAX_FUZZY_WORDS distinct words, JD
+# categories keep their first SCORING_MAX_TERMS terms, and once a resume has
+# used SCORING_CPU_BUDGET seconds of CPU in a request its remaining fuzzy
+# matches are skipped. Results that hit a limit list it under "degraded".
+# 0 disables a limit.
+app.config['SCORING_MAX_TEXT_CHARS'] = int(os.getenv("SCORING_MAX_TEXT_CHARS", "100000"))
+app.config['SCORING_MAX_FUZZY_WORDS'] = int(os.getenv("SCORING_MAX_FUZZY_WORDS", "5000"))
+app.config['SCORING_MAX_TERMS'] = int(os.getenv("SCORING_MAX_TERMS", "100"))
+app.config['SCORING_CPU_BUDGET'] = float(os.getenv("SCORING_CPU_BUDGET", "2"))
+
+# Batch scoring engine: "python" scores one resume/JD pair at a time,
+# "vectorized" scores whole batches with NumPy term matrices (needs numpy)
+SCORING_ENGINE = os.getenv("SCORING_ENGINE", "python")
+if SCORING_ENGINE == "vectorized" and np is None:
+    print("SCORING_ENGINE=vectorized needs numpy, falling back to the python engine")
+    SCORING_ENGINE = "python"
+
+# PDF extraction: optional page/character caps (0 disables them) and a process
+# pool that splits documents of at least PDF_PARALLEL_MIN_PAGES across workers
+app.config['PDF_MAX_PAGES'] = int(os.getenv("PDF_MAX_PAGES", "0"))
+app.config['PDF_MAX_CHARS'] = int(os.getenv("PDF_MAX_CHARS", "0"))
+app.config['PDF_EXTRACTION_WORKERS'] = int(os.getenv("PDF_EXTRACTION_WORKERS", "1"))
+app.config['PDF_PARALLEL_MIN_PAGES'] = int(os.getenv("PDF_PARALLEL_MIN_PAGES", "16"))
+
+# Directory holding the SQLite stores and the JD cache unless their own
+# settings point elsewhere. Nothing is written there until first use.
+app.config['DATA_DIR'] = os.getenv("DATA_DIR", "data")
+
+# Parsed-upload cache: in-memory LRU bounded by size, plus an optional
+# directory that keeps entries across restarts, pruned oldest first past
+# PARSE_CACHE_MAX_DISK_BYTES
+app.config['PARSE_CACHE_MAX_BYTES'] = int(os.getenv("PARSE_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+app.config['PARSE_CACHE_DIR'] = os.getenv("PARSE_CACHE_DIR")
+app.config['PARSE_CACHE_MAX_DISK_BYTES'] = int(os.getenv("PARSE_CACHE_MAX_DISK_BYTES", str(1024 * 1024 * 1024)))
+
+# JD extraction cache, keyed on JD text, prompt and model; kept on disk so
+# repeated JDs skip the LLM call across restarts
+app.config['JD_CACHE_MAX_BYTES'] = int(os.getenv("JD_CACHE_MAX_BYTES", str(16 * 1024 * 1024)))
+app.config['JD_CACHE_DIR'] = os.getenv("JD_CACHE_DIR", os.path.join(app.config['DATA_DIR'], "jd_cache"))
+app.config['JD_CACHE_MAX_DISK_BYTES'] = int(os.getenv("JD_CACHE_MAX_DISK_BYTES", str(256 * 1024 * 1024)))
+
+JD_EXTRACTION_MODEL = "gemma2-9b-it"
+
+# Registry of extracted JDs and their precomputed match profiles
+app.config['JD_STORE_PATH'] = os.getenv("JD_STORE_PATH", os.path.join(app.config['DATA_DIR'], "jd_store.sqlite3"))
+
+# Fuzzy match ratios memoized per (resume section, term), up to this many in
+# total, so re-scoring after a JD or resume edit only fuzzy-matches the
+# terms and sections that changed
+app.config['TERM_MATCH_CACHE_ENTRIES'] = int(os.getenv("TERM_MATCH_CACHE_ENTRIES", "500000"))
+
+# Normalized forms of this many distinct JD terms and degree strings are
+# memoized; see term_normalize_cache in /health for the hit rate
+app.config['TERM_NORMALIZE_CACHE_SIZE'] = int(os.getenv("TERM_NORMALIZE_CACHE_SIZE", "50000"))
+
+# Stored resumes and the inverted index used to shortlist them for a JD
+app.config['RESUME_STORE_PATH'] = os.getenv("RESUME_STORE_PATH",
+                                            os.path.join(app.config['DATA_DIR'], "resume_store.sqlite3"))
+# Distinct JD terms whose fuzzy matches against the stored resumes' tokens
+# are kept between shortlists
+app.config['SHORTLIST_FUZZY_CACHE_TERMS'] = int(os.getenv("SHORTLIST_FUZZY_CACHE_TERMS", "4096"))
+
+# Background jobs for uploads and batch scoring sent with ?async=1. State and
+# results live in SQLite so any worker process can answer /jobs/<id>; finished
+# jobs are purged after JOB_RETENTION_SECONDS.
+app.config['JOB_STORE_PATH'] = os.getenv("JOB_STORE_PATH", os.path.join(app.config['DATA_DIR'], "jobs.sqlite3"))
+app.config['JOB_WORKERS'] = int(os.getenv("JOB_WORKERS", "4"))
+app.config['JOB_RETENTION_SECONDS'] = int(os.getenv("JOB_RETENTION_SECONDS", str(24 * 60 * 60)))
+app.config['JOB_MAX_WAIT_SECONDS'] = float(os.getenv("JOB_MAX_WAIT_SECONDS", "30"))
+
+# Bulk resume ingestion: parse processes (0 means one per CPU) and the
+# largest archive POST /resumes/bulk accepts. Each file in it is held to
+# MAX_CONTENT_LENGTH, the limit of a single upload.
+app.config['INGEST_WORKERS'] = int(os.getenv("INGEST_WORKERS", "0"))
+app.config['INGEST_MAX_ARCHIVE_BYTES'] = int(os.getenv("INGEST_MAX_ARCHIVE_BYTES", str(512 * 1024 * 1024)))
+
+# Requests sent with "X-Profile: 1" are run under cProfile and dumped to
+# PROFILE_DIR when ALLOW_REQUEST_PROFILING is set
+app.config['ALLOW_REQUEST_PROFILING'] = os.getenv("ALLOW_REQUEST_PROFILING", "0") == "1"
+app.config['PROFILE_DIR'] = os.getenv("PROFILE_DIR", "profiles")
+
+# Groq call limits. Every JD extraction, single or batched, draws from one
+# token bucket shared by all worker processes through GROQ_RATE_LIMIT_PATH
+# and retries with exponential backoff, so concurrent uploads stay under the
+# rate limit. An extraction that would spend more than GROQ_MAX_WAIT_SECONDS
+# queued for a token or backing off fails at once instead of sleeping.
+# GROQ_BASE_URL (read by the Groq SDK) points both clients at a stub server.
+app.config['GROQ_TIMEOUT'] = float(os.getenv("GROQ_TIMEOUT", "30"))
+app.config['GROQ_MAX_RETRIES'] = int(os.getenv("GROQ_MAX_RETRIES", "3"))
+app.config['GROQ_BACKOFF_SECONDS'] = float(os.getenv("GROQ_BACKOFF_SECONDS", "0.5"))
+app.config['GROQ_MAX_CONCURRENCY'] = int(os.getenv("GROQ_MAX_CONCURRENCY", "4"))
+app.config['GROQ_REQUESTS_PER_MINUTE'] = float(os.getenv("GROQ_REQUESTS_PER_MINUTE", "30"))
+app.config['GROQ_MAX_WAIT_SECONDS'] = float(os.getenv("GROQ_MAX_WAIT_SECONDS", str(app.config['GROQ_TIMEOUT'])))
+app.config['GROQ_RATE_LIMIT_PATH'] = os.getenv("GROQ_RATE_LIMIT_PATH",
+                                               os.path.join(app.config['DATA_DIR'], "groq_rate_limit.sqlite3"))
 
 # Initialize Groq client
-client = Groq(api_key=groq_api_key)
+# Retries are ours, see complete_jd_request()
+client = Groq(api_key=groq_api_key, timeout=app.config['GROQ_TIMEOUT'], max_retries=0)
+
+# Instrumentation
+class Metrics:
+    # Thread-safe counters and latency histograms rendered in the Prometheus
+    # text format. Metrics recorded inside pool worker processes stay there.
+    BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.histograms = {}
+        self.counters = {}
+        self.help = {}
+
+    def describe(self, name, kind, text):
+        self.help[name] = (kind, text)
+
+    def observe(self, name, seconds, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self.lock:
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = self.histograms[key] = {"buckets": [0] * len(self.BUCKETS), "sum": 0.0, "count": 0}
+            for i, bound in enumerate(self.BUCKETS):
+                if seconds <= bound:
+                    histogram["buckets"][i] += 1
+            histogram["sum"] += seconds
+            histogram["count"] += 1
+
+    def inc(self, name, amount=1, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self.lock:
+            self.counters[key] = self.counters.get(key, 0) + amount
+
+    @contextmanager
+    def time(self, stage):
+        start = time.perf_counter()
+        try:
+            yield
+        except Exception:
+            self.inc("resume_stage_errors_total", stage=stage)
+            raise
+        finally:
+            self.observe("resume_stage_duration_seconds", time.perf_counter() - start, stage=stage)
+
+    @staticmethod
+    def _labels(labels, extra=()):
+        pairs = list(labels) + list(extra)
+        if not pairs:
+            return ""
+        return "{" + ",".join(f'{key}="{value}"' for key, value in pairs) + "}"
+
+    def render(self, gauges=()):
+        lines = []
+        described = set()
+        
+        def header(name, default_kind):
+            if name not in described:
+                described.add(name)
+                kind, text = self.help.get(name, (default_kind, name))
+                lines.append(f"# HELP {name} {text}")
+                lines.append(f"# TYPE {name} {kind}")
+        
+        with self.lock:
+            for (name, labels), histogram in sorted(self.histograms.items()):
+                header(name, "histogram")
+                for bound, count in zip(self.BUCKETS, histogram["buckets"]):
+                    lines.append(f"{name}_bucket{self._labels(labels, [('le', bound)])} {count}")
+                lines.append(f"{name}_bucket{self._labels(labels, [('le', '+Inf')])} {histogram['count']}")
+                lines.append(f"{name}_sum{self._labels(labels)} {histogram['sum']}")
+                lines.append(f"{name}_count{self._labels(labels)} {histogram['count']}")
+            for (name, labels), value in sorted(self.counters.items()):
+                header(name, "counter")
+                lines.append(f"{name}{self._labels(labels)} {value}")
+        
+        for name, labels, value in sorted(gauges, key=lambda gauge: gauge[0]):
+            header(name, "gauge")
+            lines.append(f"{name}{self._labels(sorted(labels.items()))} {value}")
+        
+        return "\n".join(lines) + "\n"
+
+metrics = Metrics()
+metrics.describe("resume_stage_duration_seconds", "histogram", "Time spent in each pipeline stage")
+metrics.describe("resume_stage_errors_total", "counter", "Pipeline stage calls that raised")
+metrics.describe("resume_http_request_duration_seconds", "histogram", "HTTP request latency by endpoint")
+metrics.describe("resume_http_requests_total", "counter", "HTTP requests by endpoint and status")
+metrics.describe("resume_cache_events_total", "counter", "Cache lookups by cache and outcome")
+metrics.describe("resume_cache_bytes", "gauge", "Bytes held by in-memory caches")
+metrics.describe("resume_llm_retries_total", "counter", "Retried LLM calls by error type")
+metrics.describe("resume_llm_rate_limited_total", "counter", "LLM calls failed for want of a rate limit slot in time")
+metrics.describe("resume_ingested_files_total", "counter", "Bulk-ingested files by outcome")
+
+def instrumented(stage):
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with metrics.time(stage):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorator
 
 # Text extraction functions
+def _open_pdf(source):
+    if isinstance(source, str):
+        return fitz.open(source)
+    return fitz.open(stream=source, filetype="pdf")
+
+def _extract_pdf_pages(args):
+    # Runs in a worker process: PyMuPDF documents can't be shared across
+    # threads, so each worker opens its own copy and reads a page range. A
+    # range that alone reaches max_chars stops there, as no later page can
+    # make it into the text.
+    source, start, stop, max_chars = args
+    pages = []
+    extracted = 0
+    with _open_pdf(source) as doc:
+        for i in range(start, stop):
+            pages.append(doc[i].get_text("text"))
+            extracted += len(pages[-1])
+            if max_chars and extracted >= max_chars:
+                break
+    return pages
+
+def process_pool(max_workers):
+    # Pools are started from threaded web workers, and a child forked while
+    # another thread holds a lock deadlocks on it, so pool processes come
+    # from a forkserver (or are spawned where there's none)
+    methods = multiprocessing.get_all_start_methods()
+    context = multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+    return ProcessPoolExecutor(max_workers=max_workers, mp_context=context)
+
+_pdf_extraction_pool = None
+
+def get_pdf_extraction_pool():
+    global _pdf_extraction_pool
+    if _pdf_extraction_pool is None:
+        _pdf_extraction_pool = process_pool(app.config['PDF_EXTRACTION_WORKERS'])
+    return _pdf_extraction_pool
+
+def pdf_text(doc, source=None):
+    max_pages = app.config['PDF_MAX_PAGES']
+    max_chars = app.config['PDF_MAX_CHARS']
+    workers = app.config['PDF_EXTRACTION_WORKERS']
+    
+    page_count = doc.page_count
+    if max_pages:
+        page_count = min(page_count, max_pages)
+    
+    parts = []
+    if source is not None and workers > 1 and page_count >= app.config['PDF_PARALLEL_MIN_PAGES']:
+        # Ranges are handed out in page order with at most one per worker in
+        # flight. With a character cap they are smaller, so pages past the
+        # cap are mostly never extracted; ranges still running when it is
+        # reached finish and are dropped.
+        step = math.ceil(page_count / (workers * 4 if max_chars else workers))
+        ranges = deque((source, start, min(start + step, page_count), max_chars)
+                       for start in range(0, page_count, step))
+        pool = get_pdf_extraction_pool()
+        pending = deque(pool.submit(_extract_pdf_pages, ranges.popleft()) for _ in range(min(workers, len(ranges))))
+        extracted = 0
+        while pending:
+            pages = pending.popleft().result()
+            parts.extend(pages)
+            extracted += sum(map(len, pages))
+            if max_chars and extracted >= max_chars:
+                for future in pending:
+                    future.cancel()
+                break
+            if ranges:
+                pending.append(pool.submit(_extract_pdf_pages, ranges.popleft()))
+    else:
+        extracted = 0
+        for i in range(page_count):
+            page_text = doc[i].get_text("text")
+            parts.append(page_text)
+            extracted += len(page_text)
+            if max_chars and extracted >= max_chars:
+                break
+    
+    text = "".join(parts)
+    return text[:max_chars] if max_chars else text
+
+@instrumented("parse_doc")
 def parse_doc(path):
     if path.endswith(".pdf"):
-        text = ""
         with fitz.open(path) as doc:
-            for page in doc:
-                text += page.get_text("text")
-        return text
+            return pdf_text(doc, source=path)
     elif path.endswith(".docx"):
         text = docx2txt.process(path)
         return text
     else:
         raise ValueError("Unsupported file type")
 
+@instrumented("parse_doc")
+def parse_doc_bytes(data, filename):
+    if filename.endswith(".pdf"):
+        with fitz.open(stream=data, filetype="pdf") as doc:
+            return pdf_text(doc, source=data)
+    elif filename.endswith(".docx"):
+        return docx2txt.process(io.BytesIO(data))
+    else:
+        raise ValueError("Unsupported file type")
+
 def read_file(file_path):
     try:
         with open(file_path, 'r', encoding='utf-8') as file:
@@ -54,12 +381,221 @@ def read_file(file_path):
         print(f"An error occurred: {e}")
         return ""
 
-# JD parsing functions
-def extract_jd_info(jd_text):
-    prompt_txt = read_file('prompt.txt')
+class ParseCache:
+    # Content-addressed cache of extraction results. Keys are the SHA-256 of
+    # the uploaded bytes, values are JSON-serializable dicts.
+    def __init__(self, max_bytes, disk_dir=None, max_disk_bytes=0):
+        self.max_bytes = max_bytes
+        self.disk_dir = disk_dir
+        self.max_disk_bytes = max_disk_bytes
+        # Bytes in disk_dir, counted on the first write and then kept up to
+        # date with this process's own writes
+        self.disk_size = None
+        self.entries = OrderedDict()
+        self.size = 0
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+    def _disk_path(self, key):
+        return os.path.join(self.disk_dir, f"{key}.json")
+
+    def _prune_disk(self):
+        # Deletes the least recently used entries until the directory is
+        # back under three quarters of max_disk_bytes, so pruning scans the
+        # directory only once per quarter of the budget written
+        files = []
+        for entry in os.scandir(self.disk_dir):
+            if entry.name.endswith('.json'):
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                files.append((stat.st_mtime, stat.st_size, entry.path))
+        size = sum(file_size for _, file_size, _ in files)
+        if self.max_disk_bytes and size > self.max_disk_bytes:
+            for _, file_size, path in sorted(files):
+                if size <= self.max_disk_bytes * 3 // 4:
+                    break
+                try:
+                    os.remove(path)
+                    size -= file_size
+                except OSError:
+                    pass
+        self.disk_size = size
+
+    def _store(self, key, entry, size):
+        if key in self.entries:
+            self.size -= self.entries.pop(key)[1]
+        if size > self.max_bytes:
+            return
+        self.entries[key] = (entry, size)
+        self.size += size
+        while self.size > self.max_bytes:
+            _, (_, evicted_size) = self.entries.popitem(last=False)
+            self.size -= evicted_size
+
+    def get(self, key):
+        with self.lock:
+            if key in self.entries:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return self.entries[key][0]
+        
+        if self.disk_dir:
+            try:
+                path = self._disk_path(key)
+                with open(path, 'r', encoding='utf-8') as file:
+                    raw = file.read()
+                entry = json.loads(raw)
+                # Reads count as use for pruning
+                os.utime(path)
+                with self.lock:
+                    self._store(key, entry, len(raw))
+                    self.disk_hits += 1
+                return entry
+            except (OSError, ValueError):
+                pass
+        
+        with self.lock:
+            self.misses += 1
+        return None
+
+    def put(self, key, entry):
+        raw = json.dumps(entry)
+        with self.lock:
+            self._store(key, entry, len(raw))
+        
+        if self.disk_dir:
+            path = self._disk_path(key)
+            tmp_path = None
+            try:
+                os.makedirs(self.disk_dir, exist_ok=True)
+                # A unique name, as thread ids repeat across worker processes
+                fd, tmp_path = tempfile.mkstemp(dir=self.disk_dir, prefix=f"{key}.", suffix='.tmp')
+                with os.fdopen(fd, 'w', encoding='utf-8') as file:
+                    file.write(raw)
+                os.replace(tmp_path, path)
+                with self.lock:
+                    if self.disk_size is not None:
+                        self.disk_size += len(raw)
+                    prune = self.disk_size is None or (self.max_disk_bytes and self.disk_size > self.max_disk_bytes)
+                if prune:
+                    self._prune_disk()
+            except OSError as e:
+                print(f"Could not write parse cache entry {key}: {e}")
+                if tmp_path is not None and os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+
+    def stats(self):
+        with self.lock:
+            return {
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "entries": len(self.entries),
+                "bytes": self.size,
+                "max_bytes": self.max_bytes
+            }
+
+parse_cache = ParseCache(app.config['PARSE_CACHE_MAX_BYTES'], app.config['PARSE_CACHE_DIR'],
+                         app.config['PARSE_CACHE_MAX_DISK_BYTES'])
+
+def extract_upload(file, filename, split=False):
+    data = file.read()
+    key = hashlib.sha256(data).hexdigest() + os.path.splitext(filename)[1]
     
-    if not prompt_txt:
-        prompt_txt = """You are an expert HR analyst and recruitment specialist.  
+    entry = parse_cache.get(key)
+    if entry is not None and (not split or 'resume_data' in entry):
+        return entry
+    
+    if entry is None:
+        entry = {"text": parse_doc_bytes(data, filename)}
+    else:
+        entry = dict(entry)
+    
+    if split:
+        entry["resume_data"] = split_resume(entry["text"])
+    parse_cache.put(key, entry)
+    return entry
+
+class SingleFlight:
+    # Coalesces concurrent calls that share a key: the first caller runs the
+    # function, the rest wait for and share its result.
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.calls = {}
+
+    def _claim(self, key):
+        with self.lock:
+            call = self.calls.get(key)
+            leader = call is None
+            if leader:
+                call = {"done": threading.Event()}
+                self.calls[key] = call
+        return call, leader
+
+    def _release(self, key, call):
+        with self.lock:
+            del self.calls[key]
+        call["done"].set()
+
+    @staticmethod
+    def _shared(call):
+        if "error" in call:
+            raise call["error"]
+        return call["result"]
+
+    def do(self, key, fn):
+        call, leader = self._claim(key)
+        if not leader:
+            call["done"].wait()
+            return self._shared(call)
+        
+        try:
+            call["result"] = fn()
+            return call["result"]
+        except Exception as e:
+            call["error"] = e
+            raise
+        finally:
+            self._release(key, call)
+
+    async def do_async(self, key, fn):
+        # do() for a coroutine function, coalescing with threads calling do()
+        # for the same key. Followers wait off the event loop.
+        call, leader = self._claim(key)
+        if not leader:
+            await asyncio.to_thread(call["done"].wait)
+            return self._shared(call)
+        
+        try:
+            call["result"] = await fn()
+            return call["result"]
+        except Exception as e:
+            call["error"] = e
+            raise
+        finally:
+            self._release(key, call)
+
+jd_extraction_cache = ParseCache(app.config['JD_CACHE_MAX_BYTES'], app.config['JD_CACHE_DIR'],
+                                 app.config['JD_CACHE_MAX_DISK_BYTES'])
+jd_extraction_flight = SingleFlight()
+
+def jd_extraction_key(jd_text, prompt_txt, model):
+    normalized_jd = ' '.join(jd_text.split())
+    return hashlib.sha256('\0'.join([model, prompt_txt, normalized_jd]).encode('utf-8')).hexdigest()
+
+# JD parsing functions
+JD_COMPLETION_OPTIONS = {
+    "temperature": 0.7,
+    "max_completion_tokens": 1024,
+    "top_p": 1,
+    "stream": False
+}
+
+DEFAULT_JD_PROMPT = """You are an expert HR analyst and recruitment specialist.  
         For each job position, extract the following structured information in JSON format:
         1. role: string — primary job title  
         2. overview: string — summary of role/responsibilities  
@@ -72,33 +608,265 @@ def extract_jd_info(jd_text):
         9. employment_type: string
         Return the output strictly as a JSON array, with one object per job position."""
 
+class PromptCache:
+    # A prompt file read once and kept in memory. get() re-reads it only when
+    # the file's mtime changes, so edits to prompt.txt apply without a restart
+    # and without a read per request.
+    def __init__(self, path, default):
+        self.path = path
+        self.default = default
+        self.lock = threading.Lock()
+        self.mtime = None
+        self.text = None
+
+    def _mtime(self):
+        try:
+            return os.stat(self.path).st_mtime_ns
+        except OSError:
+            return None
+
+    def get(self):
+        mtime = self._mtime()
+        if self.text is None or mtime != self.mtime:
+            with self.lock:
+                if self.text is None or mtime != self.mtime:
+                    self.text = (read_file(self.path) if mtime is not None else "") or self.default
+                    self.mtime = mtime
+        return self.text
+
+    def reload(self):
+        with self.lock:
+            self.text = None
+        return self.get()
+
+jd_prompt = PromptCache('prompt.txt', DEFAULT_JD_PROMPT)
+
+def load_jd_prompt():
+    return jd_prompt.get()
+
+def build_jd_request(jd_text):
+    prompt_txt = load_jd_prompt()
     prompt = f"{prompt_txt}\n\"\"\"{jd_text}\"\"\""
+    return prompt, jd_extraction_key(jd_text, prompt_txt, JD_EXTRACTION_MODEL)
 
+def parse_jd_response(response_text):
     try:
-        completion = client.chat.completions.create(
-            model="gemma2-9b-it",
-            messages=[{"role": "user", "content": prompt}],
-            temperature=0.7,
-            max_completion_tokens=1024,
-            top_p=1,
-            stream=False
-        )
-
-        response_text = completion.choices[0].message.content
-        
-        try:
+        with metrics.time("llm_json_parse"):
             jd_data = json.loads(response_text)
-            if not isinstance(jd_data, list):
-                jd_data = [jd_data]
-        except:
-            jd_data = []
-            
+        if not isinstance(jd_data, list):
+            jd_data = [jd_data]
+    except:
+        jd_data = []
+    return jd_data
+
+def extract_jd_info(jd_text):
+    prompt, key = build_jd_request(jd_text)
+
+    cached = jd_extraction_cache.get(key)
+    if cached is not None:
+        return cached["jd_data"]
+
+    def extract():
+        # Another caller may have finished the same extraction since the check above
+        cached = jd_extraction_cache.get(key)
+        if cached is not None:
+            return cached["jd_data"]
+        jd_data = request_jd_extraction(prompt)
+        # Failed or unparsable completions are retried next time
+        if jd_data:
+            jd_extraction_cache.put(key, {"jd_data": jd_data})
         return jd_data
+
+    return jd_extraction_flight.do(key, extract)
+
+def request_jd_extraction(prompt):
+    try:
+        return parse_jd_response(complete_jd_request(prompt))
+    except RateLimitWaitError:
+        raise
     except Exception as e:
         print(f"Error extracting JD info: {e}")
         return []
 
+def complete_jd_request(prompt):
+    # The blocking twin of AsyncJDExtractor.complete(), under the same rate
+    # limit and retry policy
+    max_retries = app.config['GROQ_MAX_RETRIES']
+    deadline = time.monotonic() + app.config['GROQ_MAX_WAIT_SECONDS']
+    for attempt in range(max_retries + 1):
+        groq_rate_limiter.wait(deadline - time.monotonic())
+        try:
+            with metrics.time("llm_completion"):
+                completion = client.chat.completions.create(
+                    model=JD_EXTRACTION_MODEL,
+                    messages=[{"role": "user", "content": prompt}],
+                    **JD_COMPLETION_OPTIONS
+                )
+            return completion.choices[0].message.content
+        except RETRYABLE_LLM_ERRORS as e:
+            if attempt == max_retries:
+                raise
+            time.sleep(retry_delay_before(deadline, llm_retry_delay(e, attempt, app.config['GROQ_BACKOFF_SECONDS'])))
+
+RETRYABLE_LLM_ERRORS = (groq.RateLimitError, groq.APITimeoutError, groq.APIConnectionError,
+                        groq.InternalServerError, asyncio.TimeoutError)
+
+def retry_after_seconds(error):
+    response = getattr(error, 'response', None)
+    try:
+        return float(response.headers.get('retry-after'))
+    except (AttributeError, TypeError, ValueError):
+        return None
+
+def llm_retry_delay(error, attempt, backoff):
+    # Jittered exponential backoff, stretched to a 429's Retry-After, which
+    # also holds back every other caller of the rate limiter
+    delay = backoff * (2 ** attempt) * random.uniform(0.5, 1.0)
+    retry_after = retry_after_seconds(error)
+    if retry_after is not None:
+        delay = max(delay, retry_after)
+        groq_rate_limiter.pause(retry_after)
+    metrics.inc("resume_llm_retries_total", reason=type(error).__name__)
+    return delay
+
+def retry_delay_before(deadline, delay):
+    # A backoff that would run past the extraction's deadline fails now
+    if time.monotonic() + delay > deadline:
+        metrics.inc("resume_llm_rate_limited_total")
+        raise RateLimitWaitError(f"Groq retry would wait {delay:.1f}s, past GROQ_MAX_WAIT_SECONDS")
+    return delay
+
+class AsyncJDExtractor:
+    # Extracts several JDs concurrently: at most max_concurrency calls in
+    # flight, each bounded by timeout and retried with jittered exponential
+    # backoff on rate limits, timeouts, connection and 5xx errors.
+    def __init__(self, async_client=None, max_concurrency=None, timeout=None, max_retries=None, backoff=None):
+        self.client = async_client or AsyncGroq(api_key=groq_api_key, max_retries=0)
+        self.semaphore = asyncio.Semaphore(max_concurrency or app.config['GROQ_MAX_CONCURRENCY'])
+        self.timeout = timeout or app.config['GROQ_TIMEOUT']
+        self.max_retries = app.config['GROQ_MAX_RETRIES'] if max_retries is None else max_retries
+        self.backoff = app.config['GROQ_BACKOFF_SECONDS'] if backoff is None else backoff
+
+    async def complete(self, prompt):
+        deadline = time.monotonic() + app.config['GROQ_MAX_WAIT_SECONDS']
+        for attempt in range(self.max_retries + 1):
+            await groq_rate_limiter.acquire(deadline - time.monotonic())
+            try:
+                async with self.semaphore:
+                    with metrics.time("llm_completion"):
+                        completion = await asyncio.wait_for(self.client.chat.completions.create(
+                            model=JD_EXTRACTION_MODEL,
+                            messages=[{"role": "user", "content": prompt}],
+                            **JD_COMPLETION_OPTIONS
+                        ), self.timeout)
+                return completion.choices[0].message.content
+            except RETRYABLE_LLM_ERRORS as e:
+                if attempt == self.max_retries:
+                    raise
+                await asyncio.sleep(retry_delay_before(deadline, llm_retry_delay(e, attempt, self.backoff)))
+
+    async def extract(self, jd_text):
+        prompt, key = build_jd_request(jd_text)
+        cached = jd_extraction_cache.get(key)
+        if cached is not None:
+            return cached["jd_data"]
+        
+        async def extract():
+            # Same flight as extract_jd_info(), so a JD uploaded through
+            # /upload/jd and /upload/jds at once costs one call
+            cached = jd_extraction_cache.get(key)
+            if cached is not None:
+                return cached["jd_data"]
+            try:
+                response_text = await self.complete(prompt)
+            except RateLimitWaitError:
+                raise
+            except Exception as e:
+                print(f"Error extracting JD info: {e}")
+                return []
+            
+            jd_data = parse_jd_response(response_text)
+            if jd_data:
+                jd_extraction_cache.put(key, {"jd_data": jd_data})
+            return jd_data
+        
+        return await jd_extraction_flight.do_async(key, extract)
+
+    async def extract_many(self, jd_texts):
+        # Identical texts in one batch share a call
+        unique_texts = list(dict.fromkeys(jd_texts))
+        results = await asyncio.gather(*(self.extract(jd_text) for jd_text in unique_texts))
+        by_text = dict(zip(unique_texts, results))
+        return [by_text[jd_text] for jd_text in jd_texts]
+
+    async def close(self):
+        await self.client.close()
+
+def extract_jd_infos(jd_texts):
+    async def run():
+        extractor = AsyncJDExtractor()
+        try:
+            return await extractor.extract_many(jd_texts)
+        finally:
+            await extractor.close()
+    
+    return asyncio.run(run())
+
 # Resume parsing functions
+SECTION_HEADER_PATTERNS = {
+    "education": r'(?:education|academics?|academic\s+background|qualifications?|educational?\s+background)',
+    "work_experience": r'(?:experience|employment\s+history|work\s+history|professional\s+experience|career\s+history|work\s+experience|job\s+experience|internships?)',
+    "skills": r'(?:skills?|technical\s+skills?|core\s+competencies|competencies|technical\s+competencies|programming\s+skills?|technologies?)',
+    "projects": r'(?:projects?|academic\s+projects?|personal\s+projects?|key\s+projects?|major\s+projects?|project\s+work)',
+    "certifications": r'(?:certifications?|certificates?|courses?|training|professional\s+development|licenses?)'
+}
+
+# One alternation tried in the order above, so the first matching section wins
+SECTION_HEADER_RE = re.compile('|'.join(
+    rf'(?P<{section_key}>^\s*{pattern}\s*:?\s*$)' for section_key, pattern in SECTION_HEADER_PATTERNS.items()))
+
+DEGREE_RE = re.compile(r'(bachelor|master|b\.?\s*tech|m\.?\s*tech|b\.?\s*sc|m\.?\s*sc|b\.?\s*e\.?|m\.?\s*e\.?|b\.?\s*a\.?|m\.?\s*a\.?|phd|doctorate|diploma)[^,\n]*', re.I)
+BRANCH_RE = re.compile(r'(computer\s+science|information\s+technology|mechanical|electrical|electronics?|civil|production|manufacturing|software|data\s+science|artificial\s+intelligence|machine\s+learning)[^,\n]*', re.I)
+CGPA_RE = re.compile(r'(?:cgpa|gpa|grade)?\s*:?\s*(\d+(?:\.\d+)?)\s*(?:/\s*(?:10|4))?', re.I)
+YEAR_RE = re.compile(r'(?:20\d{2})\s*[-–]\s*(20\d{2})|(?:graduating|graduated)?\s*(?:in\s+)?(20\d{2})', re.I)
+COLLEGE_KEYWORDS = ['university', 'college', 'institute', 'school', 'academy']
+
+BLANK_LINE_RE = re.compile(r'\n\s*\n')
+EXCESS_NEWLINES_RE = re.compile(r'\n{3,}')
+SKILL_SPLIT_RE = re.compile(r'[,|\n•\-\*→▪▫◦‣⁃]')
+SKILL_HEADER_RE = re.compile(r'^\s*(skills?|technical|technologies?)\s*:?\s*$', re.I)
+PROJECT_SPLIT_RE = re.compile(r'\n\s*\n|\n\s*[•\-\*→▪▫◦‣⁃]\s*')
+CERT_SPLIT_RE = re.compile(r'\n\s*[•\-\*→▪▫◦‣⁃]\s*|\n(?=\w)')
+EXPERIENCE_RANGE_RE = re.compile(r'(20\d{2})\s*[-–]\s*(20\d{2}|present|current)', re.I)
+
+def match_section_header(line):
+    match = SECTION_HEADER_RE.match(line.lower().strip())
+    return match.lastgroup if match else None
+
+def extract_education_entry(entry):
+    degree_match = DEGREE_RE.search(entry)
+    branch_match = BRANCH_RE.search(entry)
+    cgpa_match = CGPA_RE.search(entry)
+    year_match = YEAR_RE.search(entry)
+    
+    lines_in_entry = [line.strip() for line in entry.split('\n') if line.strip()]
+    college = ""
+    for line in lines_in_entry:
+        if any(keyword in line.lower() for keyword in COLLEGE_KEYWORDS):
+            college = line
+            break
+    if not college and lines_in_entry:
+        college = max(lines_in_entry, key=len)
+    
+    return {
+        "degree": degree_match.group(0).strip() if degree_match else "",
+        "branch": branch_match.group(0).strip() if branch_match else "",
+        "cgpa": float(cgpa_match.group(1)) if cgpa_match else None,
+        "end_year": int(year_match.group(1) or year_match.group(2)) if year_match else None,
+        "college": college
+    }
+
+@instrumented("split_resume")
 def split_resume(text):
     sections = {
         "about": "",
@@ -112,32 +880,19 @@ def split_resume(text):
     if not text or not text.strip():
         return sections
 
-    text = re.sub(r'\r\n', '\n', text)
-    text = re.sub(r'\n{3,}', '\n\n', text)
+    text = text.replace('\r\n', '\n')
+    text = EXCESS_NEWLINES_RE.sub('\n\n', text)
     
-    text_lower = text.lower()
     lines = text.split('\n')
 
-    patterns = {
-        "education": r'^\s*(education|academics?|academic\s+background|qualifications?|educational?\s+background)\s*:?\s*$',
-        "work_experience": r'^\s*(experience|employment\s+history|work\s+history|professional\s+experience|career\s+history|work\s+experience|job\s+experience|internships?)\s*:?\s*$',
-        "skills": r'^\s*(skills?|technical\s+skills?|core\s+competencies|competencies|technical\s+competencies|programming\s+skills?|technologies?)\s*:?\s*$',
-        "projects": r'^\s*(projects?|academic\s+projects?|personal\s+projects?|key\s+projects?|major\s+projects?|project\s+work)\s*:?\s*$',
-        "certifications": r'^\s*(certifications?|certificates?|courses?|training|professional\s+development|licenses?)\s*:?\s*$'
-    }
-
     matches = []
     for i, line in enumerate(lines):
-        line_lower = line.lower().strip()
-        if not line_lower:
+        if not line.strip():
             continue
-            
-        for section_key, pattern in patterns.items():
-            if re.match(pattern, line_lower):
-                matches.append((i, section_key, line.strip()))
-                break
-
-    matches.sort(key=lambda x: x[0])
+        
+        section_key = match_section_header(line)
+        if section_key:
+            matches.append((i, section_key, line.strip()))
 
     if matches:
         about_lines = lines[:matches[0][0]]
@@ -160,76 +915,36 @@ def split_resume(text):
     if "education" in raw_sections:
         edu_text = raw_sections["education"]
         if edu_text:
-            edu_entries = re.split(r'\n\s*\n', edu_text)
-            
-            for entry in edu_entries:
+            for entry in BLANK_LINE_RE.split(edu_text):
                 if not entry.strip():
                     continue
-                    
-                entry = entry.strip()
-                edu_dict = {
-                    "degree": "",
-                    "branch": "",
-                    "cgpa": None,
-                    "end_year": None,
-                    "college": ""
-                }
-                
-                degree_pattern = r'(bachelor|master|b\.?\s*tech|m\.?\s*tech|b\.?\s*sc|m\.?\s*sc|b\.?\s*e\.?|m\.?\s*e\.?|b\.?\s*a\.?|m\.?\s*a\.?|phd|doctorate|diploma)[^,\n]*'
-                degree_match = re.search(degree_pattern, entry, re.I)
-                
-                branch_pattern = r'(computer\s+science|information\s+technology|mechanical|electrical|electronics?|civil|production|manufacturing|software|data\s+science|artificial\s+intelligence|machine\s+learning)[^,\n]*'
-                branch_match = re.search(branch_pattern, entry, re.I)
-                
-                cgpa_pattern = r'(?:cgpa|gpa|grade)?\s*:?\s*(\d+(?:\.\d+)?)\s*(?:/\s*(?:10|4))?'
-                cgpa_match = re.search(cgpa_pattern, entry, re.I)
-                
-                year_pattern = r'(?:20\d{2})\s*[-–]\s*(20\d{2})|(?:graduating|graduated)?\s*(?:in\s+)?(20\d{2})'
-                year_match = re.search(year_pattern, entry, re.I)
-                
-                lines_in_entry = [line.strip() for line in entry.split('\n') if line.strip()]
-                college_keywords = ['university', 'college', 'institute', 'school', 'academy']
-                college = ""
-                for line in lines_in_entry:
-                    if any(keyword in line.lower() for keyword in college_keywords):
-                        college = line
-                        break
-                if not college and lines_in_entry:
-                    college = max(lines_in_entry, key=len)
-                
-                edu_dict["degree"] = degree_match.group(0).strip() if degree_match else ""
-                edu_dict["branch"] = branch_match.group(0).strip() if branch_match else ""
-                edu_dict["cgpa"] = float(cgpa_match.group(1)) if cgpa_match else None
-                edu_dict["end_year"] = int(year_match.group(1) or year_match.group(2)) if year_match else None
-                edu_dict["college"] = college
-                
-                sections["education"].append(edu_dict)
+                sections["education"].append(extract_education_entry(entry.strip()))
 
     if "skills" in raw_sections:
         skills_text = raw_sections["skills"]
         if skills_text:
-            skills = re.split(r'[,|\n•\-\*→▪▫◦‣⁃]', skills_text)
+            skills = SKILL_SPLIT_RE.split(skills_text)
             skills = [s.strip() for s in skills if len(s.strip()) > 1 and not s.strip().startswith(':')]
-            skills = [s for s in skills if not re.match(r'^\s*(skills?|technical|technologies?)\s*:?\s*$', s, re.I)]
+            skills = [s for s in skills if not SKILL_HEADER_RE.match(s)]
             sections["skills"] = skills
 
     if "projects" in raw_sections:
         proj_text = raw_sections["projects"]
         if proj_text:
-            projects = re.split(r'\n\s*\n|\n\s*[•\-\*→▪▫◦‣⁃]\s*', proj_text)
+            projects = PROJECT_SPLIT_RE.split(proj_text)
             projects = [p.strip().lstrip('•-*→▪▫◦‣⁃ ') for p in projects if p.strip()]
             sections["projects"] = projects
 
     if "certifications" in raw_sections:
         cert_text = raw_sections["certifications"]
         if cert_text:
-            certs = re.split(r'\n\s*[•\-\*→▪▫◦‣⁃]\s*|\n(?=\w)', cert_text)
+            certs = CERT_SPLIT_RE.split(cert_text)
             certs = [c.strip().lstrip('•-*→▪▫◦‣⁃ ') for c in certs if c.strip()]
             sections["certifications"] = certs
 
     if "work_experience" in raw_sections:
         exp_text = raw_sections["work_experience"]
-        year_ranges = re.findall(r'(20\d{2})\s*[-–]\s*(20\d{2}|present|current)', exp_text, re.I)
+        year_ranges = EXPERIENCE_RANGE_RE.findall(exp_text)
         total_months = 0
         current_year = datetime.now().year
         
@@ -246,70 +961,437 @@ def split_resume(text):
     return sections
 
 # Scoring functions
+# Runs of whitespace and punctuation collapse to one space in a single pass
+NORMALIZE_RE = re.compile(r'[^\w+#.-]+')
+
 def normalize_text(text):
     if not text:
         return ""
-    text = re.sub(r'[^\w\s+#.-]', ' ', str(text).lower())
-    text = re.sub(r'\s+', ' ', text)
-    return text.strip()
+    return NORMALIZE_RE.sub(' ', str(text).lower()).strip()
+
+_normalize_term = functools.lru_cache(maxsize=app.config['TERM_NORMALIZE_CACHE_SIZE'])(normalize_text)
+
+def normalize_term(term):
+    # normalize_text for short strings that repeat across requests: JD
+    # terms and degrees. Only strings are memoized.
+    return _normalize_term(term) if isinstance(term, str) else normalize_text(term)
+
+def normalize_term_cache_stats():
+    info = _normalize_term.cache_info()
+    lookups = info.hits + info.misses
+    return {
+        "hits": info.hits,
+        "misses": info.misses,
+        "hit_rate": round(info.hits / lookups, 4) if lookups else 0.0,
+        "terms": info.currsize,
+        "max_terms": info.maxsize
+    }
+
+def cap_text(text, limits):
+    max_chars = app.config['SCORING_MAX_TEXT_CHARS']
+    if max_chars and isinstance(text, str) and len(text) > max_chars:
+        limits.add("text_truncated")
+        return text[:max_chars]
+    return text
+
+class ScoringBudget:
+    # CPU time one resume may spend on fuzzy matching in a request, measured
+    # on the scoring thread. Once it is spent, fuzzy matches are skipped
+    # and counted, so results can be flagged as degraded.
+    def __init__(self, seconds):
+        self.seconds = seconds
+        self.deadline = time.thread_time() + seconds if seconds > 0 else None
+        self.skipped = 0
+
+    def spent(self):
+        if self.deadline is not None and time.thread_time() > self.deadline:
+            self.skipped += 1
+            return True
+        return False
+
+_scoring_budget = threading.local()
+
+def current_scoring_budget():
+    return getattr(_scoring_budget, 'current', None)
+
+@contextmanager
+def using_scoring_budget(budget):
+    previous = current_scoring_budget()
+    _scoring_budget.current = budget
+    try:
+        yield budget
+    finally:
+        _scoring_budget.current = previous
+
+def scoring_budget(seconds=None):
+    # Scores inside the block share one budget, SCORING_CPU_BUDGET by default;
+    # outside any block scoring is unbounded
+    return using_scoring_budget(ScoringBudget(app.config['SCORING_CPU_BUDGET'] if seconds is None else seconds))
+
+def per_resume_budget():
+    # A fresh copy of the current budget for the next resume of a batch
+    budget = current_scoring_budget()
+    return scoring_budget(budget.seconds) if budget is not None else nullcontext()
+
+R_PATTERNS = [re.compile(r'\br\b(?:\s+(?:programming|language|statistical|data|analysis))?'),
+              re.compile(r'(?:programming|language|statistical)\s+r\b'),
+              re.compile(r'r\s+(?:studio|programming|statistical)')]
+
+TECH_CONTEXTS = ['programming', 'development', 'software', 'technology',
+                 'framework', 'library', 'tool', 'platform', 'database']
+
+@functools.lru_cache(maxsize=65536)
+def char_occurrence_keys(word):
+    seen = {}
+    keys = []
+    for ch in word:
+        count = seen.get(ch, 0) + 1
+        seen[ch] = count
+        keys.append((ch, count))
+    return tuple(keys)
+
+class FuzzyWordIndex:
+    # Inverted index from (character, occurrence) to the distinct words that
+    # contain it. Summing postings gives the character multiset overlap with a
+    # term, which bounds SequenceMatcher.ratio() from above, so only words
+    # that can still reach the threshold are compared.
+    def __init__(self, words):
+        self.words = []
+        self.lengths = []
+        self.postings = {}
+        for word in words:
+            self.add(word)
+
+    def add(self, word):
+        i = len(self.words)
+        self.words.append(word)
+        self.lengths.append(len(word))
+        for key in char_occurrence_keys(word):
+            self.postings.setdefault(key, []).append(i)
+
+    def bounds(self, term, threshold, start=0):
+        # (word, bound) for the words added at position start or later whose
+        # bound reaches the threshold
+        term_len = len(term)
+        postings = (self.postings.get(key, ()) for key in char_occurrence_keys(term))
+        if start:
+            postings = (ids[bisect.bisect_left(ids, start):] for ids in postings)
+        overlaps = Counter(chain.from_iterable(postings))
+        for i, overlap in overlaps.items():
+            bound = 2.0 * overlap / (term_len + self.lengths[i])
+            if bound >= threshold:
+                yield self.words[i], bound
+
+    def best_ratio(self, term, threshold, budget=None):
+        best_score = 0.0
+        for word, _ in self.bounds(term, threshold):
+            if budget is not None and budget.spent():
+                break
+            similarity = SequenceMatcher(None, term, word).ratio()
+            if similarity >= threshold:
+                best_score = max(best_score, similarity)
+        return best_score
+
+class TextIndex:
+    # Normalizes a text blob once and keeps the lookups the matchers need,
+    # so scoring many terms against the same blob never re-normalizes it.
+    def __init__(self, text, normalized=False):
+        # Scoring limits this text ran into, see SCORING_MAX_TEXT_CHARS
+        self.limits = set()
+        text = cap_text(text or "", self.limits)
+        self.text = text if normalized else normalize_text(text)
+        self.words = self.text.split()
+        self.tokens = set(self.words)
+        self.has_tech_context = any(context in self.text for context in TECH_CONTEXTS)
+        self._fuzzy = None
+        self._fuzzy_words = None
+        self._key = None
+        # Parts whose words together are this text's words; fuzzy matching
+        # takes the best ratio over them, see TermMatchCache
+        self.sections = [self]
+        max_words = app.config['SCORING_MAX_FUZZY_WORDS']
+        if max_words and len(self.tokens) > max_words:
+            self.limits.add("fuzzy_words_capped")
+
+    @property
+    def fuzzy_words(self):
+        # The distinct words fuzzy matching considers: all of them, or the
+        # first SCORING_MAX_FUZZY_WORDS in text order
+        if self._fuzzy_words is None:
+            max_words = app.config['SCORING_MAX_FUZZY_WORDS']
+            if max_words and len(self.tokens) > max_words:
+                self._fuzzy_words = list(dict.fromkeys(self.words))[:max_words]
+            else:
+                self._fuzzy_words = self.tokens
+        return self._fuzzy_words
+
+    @property
+    def fuzzy(self):
+        if self._fuzzy is None:
+            self._fuzzy = FuzzyWordIndex(self.fuzzy_words)
+        return self._fuzzy
+
+    @property
+    def key(self):
+        if self._key is None:
+            self._key = hashlib.blake2b(self.text.encode('utf-8'), digest_size=16).digest()
+        return self._key
+
+    def contains(self, term_normalized):
+        # Substring semantics, as the matchers have always used; the token
+        # set only short-circuits the common whole-word case.
+        return term_normalized in self.tokens or term_normalized in self.text
+
+    def matches_r(self):
+        return any(pattern.search(self.text) for pattern in R_PATTERNS)
+
+def as_text_index(text):
+    if isinstance(text, TextIndex):
+        return text
+    return TextIndex(text)
+
+class ResumeIndex:
+    # Everything score_resume needs from a resume, normalized once and
+    # reusable across any number of JDs.
+    def __init__(self, resume_data):
+        self.resume_data = resume_data
+        self.skills = resume_data.get('skills', [])
+        limits = set()
+        parts = [resume_data.get('about', ''), " ".join(self.skills), " ".join(resume_data.get('projects', []))]
+        text = cap_text(" ".join(parts), limits)
+        sections = None
+        if limits:
+            self.resume_text = normalize_text(text)
+        else:
+            # normalize_text turns every run of separators into one space, so
+            # normalizing the sections apart and joining them gives the same
+            # text, and each section can be fuzzy-matched on its own
+            parts = [normalize_text(part) for part in parts]
+            self.resume_text = ' '.join(part for part in parts if part)
+            sections = [TextIndex(part, normalized=True) for part in parts if part]
+        self.text = TextIndex(self.resume_text, normalized=True)
+        # normalize_text is idempotent and works character by character, so
+        # only the appended skills need normalizing again
+        skills_text = normalize_text(cap_text(' '.join(self.skills), limits))
+        self.combined = TextIndex(' '.join(part for part in [self.resume_text, skills_text] if part),
+                                  normalized=True)
+        # The appended skills repeat the skills section's words, so both
+        # texts split into the same sections
+        for index in [self.text, self.combined]:
+            if sections is not None and "fuzzy_words_capped" not in index.limits:
+                index.sections = sections
+        self.education = [
+            (normalize_term(cap_text(edu.get('degree', ''), limits)), TextIndex(edu.get('branch', '')))
+            for edu in resume_data.get('education', [])
+        ]
+        self.text.limits.update(limits)
 
-def fuzzy_match_score(term, text, threshold=0.6):
-    term_normalized = normalize_text(term)
-    text_normalized = normalize_text(text)
+    def limits(self):
+        return self.text.limits.union(self.combined.limits, *(index.limits for _, index in self.education))
+
+def fuzzy_match_score(term, text, threshold=0.6, mode=None, term_normalized=None):
+    if term_normalized is None:
+        term_normalized = normalize_term(term)
+    index = as_text_index(text)
     
-    if term_normalized in text_normalized:
+    if index.contains(term_normalized):
         return 1.0
     
     words_in_term = term_normalized.split()
     best_score = 0.0
     
     if len(words_in_term) > 1:
-        word_matches = sum(1 for word in words_in_term if word in text_normalized)
+        word_matches = sum(1 for word in words_in_term if index.contains(word))
         if word_matches == len(words_in_term):
             return 0.9
         elif word_matches > 0:
             best_score = max(best_score, word_matches / len(words_in_term) * 0.7)
     
-    text_words = text_normalized.split()
-    for word in text_words:
-        similarity = SequenceMatcher(None, term_normalized, word).ratio()
-        if similarity >= threshold:
-            best_score = max(best_score, similarity)
-    
-    return best_score
+    return max(best_score, fuzzy_word_ratio(term_normalized, index, threshold, mode))
+
+def fuzzy_word_ratio(term_normalized, index, threshold=0.6, mode=None):
+    # Best SequenceMatcher ratio of the term against a single resume word,
+    # or 0.0 once the current scoring budget is spent
+    budget = current_scoring_budget()
+    if budget is not None and budget.spent():
+        return 0.0
+    if (mode or FUZZY_MATCH_MODE) == "compat":
+        best_score = 0.0
+        words = index.words if index.fuzzy_words is index.tokens else index.fuzzy_words
+        for word in words:
+            if budget is not None and budget.spent():
+                break
+            similarity = SequenceMatcher(None, term_normalized, word).ratio()
+            if similarity >= threshold:
+                best_score = max(best_score, similarity)
+        return best_score
+    return term_match_cache.best_ratio(index, term_normalized, threshold, budget)
 
-def check_presence_advanced(term, text_blob, context_boost=False):
-    term_lower = normalize_text(term)
-    text_lower = normalize_text(text_blob)
+def check_presence_advanced(term, text_blob, context_boost=False, term_normalized=None):
+    term_lower = normalize_term(term) if term_normalized is None else term_normalized
+    index = as_text_index(text_blob)
     
     if term_lower == 'r':
-        r_patterns = [r'\br\b(?:\s+(?:programming|language|statistical|data|analysis))?',
-                     r'(?:programming|language|statistical)\s+r\b',
-                     r'r\s+(?:studio|programming|statistical)']
-        return any(re.search(pattern, text_lower) for pattern in r_patterns)
-    
-    score = fuzzy_match_score(term, text_blob)
-    
-    if context_boost and score > 0.5:
-        tech_contexts = ['programming', 'development', 'software', 'technology', 
-                        'framework', 'library', 'tool', 'platform', 'database']
-        for context in tech_contexts:
-            if context in text_lower:
-                score = min(1.0, score + 0.1)
-                break
+        return index.matches_r()
+    
+    score = fuzzy_match_score(term, index, term_normalized=term_lower)
+    
+    if context_boost and score > 0.5 and index.has_tech_context:
+        score = min(1.0, score + 0.1)
     
     return score
 
-def calculate_skills_score_advanced(resume_text, resume_skills, jd_skills):
+class TermMatchCache:
+    # Best fuzzy ratio of a term against the words of one text section,
+    # keyed by (hash of the section, normalized term, threshold). A text's
+    # ratio is the best over its sections, so editing one resume section
+    # only fuzzy-matches that section again, and editing a JD only its new
+    # terms; the exact and all-words checks are cheap and always rerun. An
+    # LRU bounds the total number of entries; max_entries=0 disables it.
+    def __init__(self, max_entries):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def best_ratio(self, index, term_normalized, threshold, budget=None):
+        best_score = 0.0
+        for section in index.sections:
+            # Ratios over a capped word list depend on the cap, so they aren't shared
+            if self.max_entries <= 0 or "fuzzy_words_capped" in section.limits:
+                best_score = max(best_score, section.fuzzy.best_ratio(term_normalized, threshold, budget))
+                continue
+            key = (section.key, term_normalized, threshold)
+            with self.lock:
+                score = self.entries.get(key)
+                if score is not None:
+                    self.entries.move_to_end(key)
+                    self.hits += 1
+                else:
+                    self.misses += 1
+            if score is None:
+                skipped = budget.skipped if budget is not None else 0
+                score = section.fuzzy.best_ratio(term_normalized, threshold, budget)
+                # A ratio cut short by the CPU budget is not the real one
+                if budget is None or budget.skipped == skipped:
+                    with self.lock:
+                        self.entries[key] = score
+                        while len(self.entries) > self.max_entries:
+                            self.entries.popitem(last=False)
+            best_score = max(best_score, score)
+        return best_score
+
+    def stats(self):
+        with self.lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "entries": len(self.entries),
+                "max_entries": self.max_entries
+            }
+
+term_match_cache = TermMatchCache(app.config['TERM_MATCH_CACHE_ENTRIES'])
+
+SKILL_WEIGHTS = {'technical': 30, 'domain': 15, 'soft': 5}
+KEYWORD_WEIGHTS = {'primary': 6, 'secondary': 4}
+
+DEGREE_HIERARCHY = {
+    'phd': 4, 'doctorate': 4, 'doctoral': 4,
+    'master': 3, 'mtech': 3, 'msc': 3, 'me': 3, 'ma': 3,
+    'bachelor': 2, 'btech': 2, 'bsc': 2, 'be': 2, 'ba': 2,
+    'diploma': 1, 'certificate': 1
+}
+
+# DEGREE_HIERARCHY as one pattern per level, highest level first, so a
+# degree's level is that of the first pattern found in it
+DEGREE_LEVEL_PATTERNS = [
+    (level, re.compile('|'.join(re.escape(degree) for degree, degree_level in DEGREE_HIERARCHY.items()
+                                if degree_level == level)))
+    for level in sorted(set(DEGREE_HIERARCHY.values()), reverse=True)
+]
+
+def normalize_terms(terms):
+    return [(term, normalize_term(term)) for term in terms]
+
+def degree_level(degree_text):
+    return next((level for level, pattern in DEGREE_LEVEL_PATTERNS if pattern.search(degree_text)), 0)
+
+def education_requirements(jd_edu):
+    # Lists extracted as null count as empty, like the skill categories, and
+    # so do criteria that aren't objects (null, or degrees given as a list)
+    if not isinstance(jd_edu, dict):
+        jd_edu = {}
+    degrees = jd_edu.get('degrees')
+    if not isinstance(degrees, dict):
+        degrees = {}
+    required_degrees = normalize_terms(degrees.get('required') or [])
+    return {
+        "required_degrees": required_degrees,
+        "preferred_degrees": normalize_terms(degrees.get('preferred') or []),
+        "fields": normalize_terms(jd_edu.get('fields') or []),
+        "required_level": max((degree_level(normalized) for _, normalized in required_degrees), default=0)
+    }
+
+class JDProfile:
+    # The JD-side half of score_resume: skill, keyword and degree terms
+    # normalized once so a JD can be scored against many resumes.
+    def __init__(self, jd):
+        self.jd = jd
+        jd_skills = jd['must_have_skills']
+        jd_keywords = jd.get('keywords', {})
+        # Scoring limits this JD ran into, see SCORING_MAX_TERMS
+        self.limits = set()
+        # A category extracted as null counts as empty, as it always has
+        self.skill_terms = {category: self._capped_terms(jd_skills.get(category) or [])
+                            for category in SKILL_WEIGHTS}
+        self.keyword_terms = {category: self._capped_terms(jd_keywords.get(category) or [])
+                              for category in KEYWORD_WEIGHTS} if jd_keywords else None
+        self._education = None
+
+    def _capped_terms(self, terms):
+        max_terms = app.config['SCORING_MAX_TERMS']
+        if max_terms and len(terms) > max_terms:
+            self.limits.add("terms_capped")
+            terms = terms[:max_terms]
+        return normalize_terms(terms)
+
+    @property
+    def education(self):
+        # Built on first use: score_resume only reads the JD's education
+        # criteria when the resume lists some education
+        if self._education is None:
+            self._education = education_requirements(self.jd.get('eligibility_criteria', {}))
+        return self._education
+
+    def to_dict(self):
+        return {"skill_terms": self.skill_terms, "keyword_terms": self.keyword_terms, "education": self.education,
+                "limits": sorted(self.limits)}
+
+    @classmethod
+    def from_dict(cls, jd, data):
+        profile = cls.__new__(cls)
+        profile.jd = jd
+        profile.skill_terms = data["skill_terms"]
+        profile.keyword_terms = data["keyword_terms"]
+        profile._education = data["education"]
+        profile.limits = set(data.get("limits", []))
+        return profile
+
+@instrumented("calculate_skills_score_advanced")
+def calculate_skills_score_advanced(resume_text, resume_skills, jd_skills, index=None, terms=None, details=True):
+    # details=False skips building the breakdown and returns None for it
     total_score = 0
     detailed_breakdown = {}
     
-    combined_text = f"{resume_text} {' '.join(resume_skills)}"
+    if index is None:
+        index = TextIndex(f"{resume_text} {' '.join(resume_skills)}")
+    if terms is None:
+        terms = {category: normalize_terms(jd_skills.get(category) or []) for category in SKILL_WEIGHTS}
     
     skill_categories = {
-        'technical': {'weight': 30, 'skills': jd_skills.get('technical', [])},
-        'domain': {'weight': 15, 'skills': jd_skills.get('domain', [])},
-        'soft': {'weight': 5, 'skills': jd_skills.get('soft', [])}
+        category: {'weight': weight, 'skills': terms[category]}
+        for category, weight in SKILL_WEIGHTS.items()
     }
     
     for category, info in skill_categories.items():
@@ -321,14 +1403,16 @@ def calculate_skills_score_advanced(resume_text, resume_skills, jd_skills):
         matches = []
         category_score = 0
         
-        for skill in info['skills']:
-            match_score = check_presence_advanced(skill, combined_text, context_boost=True)
+        for skill, skill_normalized in info['skills']:
+            match_score = check_presence_advanced(skill, index, context_boost=True,
+                                                  term_normalized=skill_normalized)
             if match_score > 0.3:
-                matches.append({
-                    'skill': skill,
-                    'match_score': round(match_score, 2),
-                    'points': (match_score / len(info['skills'])) * info['weight']
-                })
+                if details:
+                    matches.append({
+                        'skill': skill,
+                        'match_score': round(match_score, 2),
+                        'points': (match_score / len(info['skills'])) * info['weight']
+                    })
                 category_score += (match_score / len(info['skills'])) * info['weight']
         
         detailed_breakdown[category] = {
@@ -338,11 +1422,21 @@ def calculate_skills_score_advanced(resume_text, resume_skills, jd_skills):
         }
         total_score += category_score
     
-    return total_score, detailed_breakdown
+    return total_score, detailed_breakdown if details else None
 
+def experience_bound(value):
+    return value if isinstance(value, (int, float)) and not isinstance(value, bool) else None
+
+@instrumented("calculate_experience_score_advanced")
 def calculate_experience_score_advanced(resume_exp, jd_exp):
-    min_exp_required = jd_exp.get('min', 0)
-    max_exp_preferred = jd_exp.get('preferred', min_exp_required + 3)
+    # Criteria that aren't an object, and bounds that aren't numbers (null,
+    # "3 years"), count as missing
+    if not isinstance(jd_exp, dict):
+        jd_exp = {}
+    min_exp_required = experience_bound(jd_exp.get('min', 0))
+    max_exp_preferred = experience_bound(jd_exp.get('preferred'))
+    if max_exp_preferred is None and min_exp_required is not None:
+        max_exp_preferred = min_exp_required + 3
     
     if min_exp_required is None or min_exp_required == 0:
         return 25, "No minimum experience required"
@@ -360,13 +1454,50 @@ def calculate_experience_score_advanced(resume_exp, jd_exp):
     else:
         return 0, f"Below minimum requirement ({resume_exp} < {min_exp_required})"
 
-def calculate_education_score_advanced(resume_edu, jd_edu):
+def education_degree_points(degree_text, requirements):
+    # Points for one education entry's normalized degree text
+    points = 0
+    reasons = []
+    
+    if requirements['required_degrees']:
+        for req_degree, req_normalized in requirements['required_degrees']:
+            if req_normalized in degree_text:
+                points += 10
+                reasons.append(f"Required degree match: {req_degree}")
+                break
+        else:
+            resume_level = degree_level(degree_text)
+            req_level = requirements['required_level']
+            
+            if resume_level >= req_level and req_level > 0:
+                points += 7
+                reasons.append("Degree level meets/exceeds requirement")
+    
+    for pref_degree, pref_normalized in requirements['preferred_degrees']:
+        if pref_normalized in degree_text:
+            points += 3
+            reasons.append(f"Preferred degree match: {pref_degree}")
+            break
+    
+    return points, reasons
+
+def education_field_points(field_text, requirements):
+    # Points for one education entry's branch (a TextIndex)
+    for req_field, field_normalized in requirements['fields']:
+        field_score = fuzzy_match_score(req_field, field_text, term_normalized=field_normalized)
+        if field_score > 0.6:
+            return 5 * field_score, [f"Field match: {req_field} ({field_score:.2f})"]
+    return 0, []
+
+@instrumented("calculate_education_score_advanced")
+def calculate_education_score_advanced(resume_edu, jd_edu, index=None, requirements=None):
     if not resume_edu:
         return 0, "No education information provided"
     
-    required_degrees = jd_edu.get('degrees', {}).get('required', [])
-    preferred_degrees = jd_edu.get('degrees', {}).get('preferred', [])
-    required_fields = jd_edu.get('fields', [])
+    if requirements is None:
+        requirements = education_requirements(jd_edu)
+    required_degrees = requirements['required_degrees']
+    required_fields = requirements['fields']
     
     if not required_degrees and not required_fields:
         return 15, "No specific education requirements"
@@ -374,56 +1505,15 @@ def calculate_education_score_advanced(resume_edu, jd_edu):
     max_score = 0
     best_match_reason = ""
     
-    for edu in resume_edu:
-        degree_text = normalize_text(edu.get('degree', ''))
-        field_text = normalize_text(edu.get('branch', ''))
-        
-        current_score = 0
-        reasons = []
-        
-        if required_degrees:
-            for req_degree in required_degrees:
-                if normalize_text(req_degree) in degree_text:
-                    current_score += 10
-                    reasons.append(f"Required degree match: {req_degree}")
-                    break
-            else:
-                degree_hierarchy = {
-                    'phd': 4, 'doctorate': 4, 'doctoral': 4,
-                    'master': 3, 'mtech': 3, 'msc': 3, 'me': 3, 'ma': 3,
-                    'bachelor': 2, 'btech': 2, 'bsc': 2, 'be': 2, 'ba': 2,
-                    'diploma': 1, 'certificate': 1
-                }
-                
-                resume_level = 0
-                req_level = 0
-                
-                for degree, level in degree_hierarchy.items():
-                    if degree in degree_text:
-                        resume_level = max(resume_level, level)
-                    for req_degree in required_degrees:
-                        if degree in normalize_text(req_degree):
-                            req_level = max(req_level, level)
-                
-                if resume_level >= req_level and req_level > 0:
-                    current_score += 7
-                    reasons.append("Degree level meets/exceeds requirement")
-        
-        if preferred_degrees:
-            for pref_degree in preferred_degrees:
-                if normalize_text(pref_degree) in degree_text:
-                    current_score += 3
-                    reasons.append(f"Preferred degree match: {pref_degree}")
-                    break
-        
-        if required_fields:
-            for req_field in required_fields:
-                field_score = fuzzy_match_score(req_field, field_text)
-                if field_score > 0.6:
-                    field_points = 5 * field_score
-                    current_score += field_points
-                    reasons.append(f"Field match: {req_field} ({field_score:.2f})")
-                    break
+    if index is None:
+        index = [(normalize_term(edu.get('degree', '')), TextIndex(edu.get('branch', '')))
+                 for edu in resume_edu]
+    
+    for degree_text, field_text in index:
+        degree_points, reasons = education_degree_points(degree_text, requirements)
+        field_points, field_reasons = education_field_points(field_text, requirements)
+        current_score = degree_points + field_points
+        reasons = reasons + field_reasons
         
         if current_score > max_score:
             max_score = current_score
@@ -431,16 +1521,23 @@ def calculate_education_score_advanced(resume_edu, jd_edu):
     
     return min(15, round(max_score, 2)), best_match_reason
 
-def calculate_keywords_score_advanced(resume_text, jd_keywords):
+@instrumented("calculate_keywords_score_advanced")
+def calculate_keywords_score_advanced(resume_text, jd_keywords, index=None, terms=None, details=True):
+    # details=False skips building the breakdown and returns None for it
     if not jd_keywords:
         return 10, {}
     
+    if index is None:
+        index = TextIndex(resume_text)
+    if terms is None:
+        terms = {category: normalize_terms(jd_keywords.get(category) or []) for category in KEYWORD_WEIGHTS}
+    
     detailed_matches = {}
     total_score = 0
     
     keyword_categories = {
-        'primary': {'weight': 6, 'keywords': jd_keywords.get('primary', [])},
-        'secondary': {'weight': 4, 'keywords': jd_keywords.get('secondary', [])}
+        category: {'weight': weight, 'keywords': terms[category]}
+        for category, weight in KEYWORD_WEIGHTS.items()
     }
     
     for category, info in keyword_categories.items():
@@ -452,15 +1549,16 @@ def calculate_keywords_score_advanced(resume_text, jd_keywords):
         matches = []
         category_score = 0
         
-        for keyword in info['keywords']:
-            match_score = check_presence_advanced(keyword, resume_text)
+        for keyword, keyword_normalized in info['keywords']:
+            match_score = check_presence_advanced(keyword, index, term_normalized=keyword_normalized)
             if match_score > 0.3:
                 points = (match_score / len(info['keywords'])) * info['weight']
-                matches.append({
-                    'keyword': keyword,
-                    'match_score': round(match_score, 2),
-                    'points': round(points, 2)
-                })
+                if details:
+                    matches.append({
+                        'keyword': keyword,
+                        'match_score': round(match_score, 2),
+                        'points': round(points, 2)
+                    })
                 category_score += points
         
         detailed_matches[category] = {
@@ -469,26 +1567,49 @@ def calculate_keywords_score_advanced(resume_text, jd_keywords):
         }
         total_score += category_score
     
-    return total_score, detailed_matches
+    return total_score, detailed_matches if details else None
 
-def score_resume(resume_data, jd):
-    resume_text = normalize_text(" ".join([
-        resume_data.get('about', ''),
-        " ".join(resume_data.get('skills', [])),
-        " ".join(resume_data.get('projects', []))
-    ]))
+def score_components(resume_data, jd, index=None, profile=None, skills=None, keywords=None, details=True,
+                     degraded=None):
+    # The four scorers' outputs for one resume/JD pair, as
+    # (skills, experience, education, keywords) (score, details) pairs.
+    # skills and keywords take pairs already computed for this resume, as
+    # the vectorized batch engine does. The scoring limits the pair ran
+    # into are added to the degraded set when one is passed.
+    if index is None:
+        index = ResumeIndex(resume_data)
+    if profile is None:
+        profile = JDProfile(jd)
+    budget = current_scoring_budget()
+    skipped = budget.skipped if budget is not None else 0
     
-    skills_score, skills_details = calculate_skills_score_advanced(
-        resume_text, resume_data.get('skills', []), jd['must_have_skills'])
+    if skills is None:
+        skills = calculate_skills_score_advanced(
+            index.resume_text, index.skills, jd['must_have_skills'],
+            index=index.combined, terms=profile.skill_terms, details=details)
     
-    experience_score, exp_reason = calculate_experience_score_advanced(
+    experience = calculate_experience_score_advanced(
         resume_data.get('experience_years', 0), jd.get('experience_years', {}))
     
-    education_score, edu_reason = calculate_education_score_advanced(
-        resume_data.get('education', []), jd.get('eligibility_criteria', {}))
+    resume_education = resume_data.get('education', [])
+    education = calculate_education_score_advanced(
+        resume_education, jd.get('eligibility_criteria', {}), index=index.education,
+        requirements=profile.education if resume_education else None)
+    
+    if keywords is None:
+        keywords = calculate_keywords_score_advanced(
+            index.resume_text, jd.get('keywords', {}), index=index.text, terms=profile.keyword_terms,
+            details=details)
     
-    keywords_score, keywords_details = calculate_keywords_score_advanced(
-        resume_text, jd.get('keywords', {}))
+    if degraded is not None:
+        degraded.update(index.limits(), profile.limits)
+        if budget is not None and budget.skipped > skipped:
+            degraded.add("cpu_budget_exhausted")
+    return skills, experience, education, keywords
+
+def build_result(resume_data, jd, components, degraded=()):
+    (skills_score, skills_details), (experience_score, exp_reason), \
+        (education_score, edu_reason), (keywords_score, keywords_details) = components
     
     total_score = skills_score + experience_score + education_score + keywords_score
     
@@ -508,10 +1629,1344 @@ def score_resume(resume_data, jd):
             "keywords_breakdown": keywords_details
         }
     }
+    # Only results that hit a scoring limit say so
+    if degraded:
+        result["degraded"] = sorted(degraded)
     
     return result
 
+@instrumented("score_resume")
+def score_resume(resume_data, jd, index=None, profile=None, skills=None, keywords=None, degraded=()):
+    # degraded takes limits already hit while scoring this pair elsewhere
+    degraded = set(degraded)
+    components = score_components(resume_data, jd, index=index, profile=profile, skills=skills,
+                                  keywords=keywords, degraded=degraded)
+    return build_result(resume_data, jd, components, degraded)
+
+class ScoreSummary:
+    # score_resume's scores for one pair without the skill and keyword
+    # breakdowns. detailed_analysis re-scores the pair on first access, so
+    # rankings only pay for the breakdowns of the results they return.
+    # The re-scoring gets the CPU budget the summary was scored under.
+    __slots__ = ('resume_data', 'jd', 'profile', 'components', 'degraded', 'budget', '_result')
+
+    def __init__(self, resume_data, jd, profile, components, degraded=(), budget=None):
+        self.resume_data = resume_data
+        self.jd = jd
+        self.profile = profile
+        self.components = components
+        self.degraded = sorted(degraded)
+        self.budget = budget
+        self._result = None
+
+    @property
+    def total_score(self):
+        return round(sum(score for score, _ in self.components), 2)
+
+    def result(self):
+        if self._result is None:
+            with scoring_budget(self.budget) if self.budget is not None else nullcontext():
+                self._result = score_resume(self.resume_data, self.jd, profile=self.profile)
+        return self._result
+
+    @property
+    def detailed_analysis(self):
+        return self.result()["detailed_analysis"]
+
+    def to_dict(self, detailed=True):
+        if detailed:
+            return self.result()
+        # Breakdowns left out, experience and education reasons kept
+        result = build_result(self.resume_data, self.jd, self.components, self.degraded)
+        del result["detailed_analysis"]["skills_breakdown"], result["detailed_analysis"]["keywords_breakdown"]
+        return result
+
+@instrumented("score_resume_summary")
+def score_resume_summary(resume_data, jd, index=None, profile=None, skills=None, keywords=None, degraded=()):
+    if profile is None:
+        profile = JDProfile(jd)
+    degraded = set(degraded)
+    components = score_components(resume_data, jd, index=index, profile=profile,
+                                  skills=skills, keywords=keywords, details=False, degraded=degraded)
+    budget = current_scoring_budget()
+    return ScoreSummary(resume_data, jd, profile, components, degraded,
+                        budget.seconds if budget is not None else None)
+
+def rank_results(results, top_k=None):
+    # Ranks (key, result) pairs, where results are score_resume dicts or
+    # ScoreSummary objects
+    ranked = sorted(results, key=lambda item: -(item[1].total_score if isinstance(item[1], ScoreSummary)
+                                                else item[1]['total_score']))
+    return ranked[:top_k] if top_k else ranked
+
+def score_resume_rows(resumes, jds, profiles=None, summaries=False):
+    # summaries=True returns ScoreSummary objects instead of result dicts
+    if profiles is None:
+        profiles = [JDProfile(jd) for jd in jds]
+    if SCORING_ENGINE == "vectorized":
+        return score_resume_rows_vectorized(resumes, jds, profiles, summaries)
+    score = score_resume_summary if summaries else score_resume
+    rows = []
+    for resume_data in resumes:
+        with per_resume_budget():
+            index = ResumeIndex(resume_data)
+            rows.append([score(resume_data, jd, index=index, profile=profile)
+                         for jd, profile in zip(jds, profiles)])
+    return rows
+
+class TermMatrix:
+    # Match scores of every distinct JD term against every resume text of a
+    # batch, as a (resumes x terms) float matrix. Exact and all-words matches
+    # come from a boolean presence matrix over the terms and their words;
+    # only the residual cells fall back to fuzzy matching. Each cell equals
+    # check_presence_advanced() for the same term and text.
+    def __init__(self, indexes, terms, context_boost=False):
+        self.terms = list(dict.fromkeys(terms))
+        self.columns = {term: i for i, term in enumerate(self.terms)}
+        
+        words = [word for term in self.terms for word in term.split() if word not in self.columns]
+        vocabulary = self.terms + list(dict.fromkeys(words))
+        vocabulary_columns = {term: i for i, term in enumerate(vocabulary)}
+        present = np.zeros((len(indexes), len(vocabulary)), dtype=bool)
+        for i, index in enumerate(indexes):
+            present[i] = [index.contains(term) for term in vocabulary]
+        
+        scores = np.zeros((len(indexes), len(self.terms)))
+        residual = np.zeros((len(indexes), len(self.terms)), dtype=bool)
+        for t, term in enumerate(self.terms):
+            exact = present[:, t]
+            words_in_term = term.split()
+            if len(words_in_term) > 1:
+                word_matches = present[:, [vocabulary_columns[word] for word in words_in_term]].sum(axis=1)
+                all_words = word_matches == len(words_in_term)
+                scores[:, t] = np.where(exact, 1.0, np.where(all_words, 0.9, word_matches / len(words_in_term) * 0.7))
+                residual[:, t] = ~exact & ~all_words
+            else:
+                scores[:, t] = exact
+                residual[:, t] = ~exact
+        
+        # check_presence_advanced() returns matches_r()'s bool for 'r', which
+        # shows up as-is in the breakdowns, so those cells keep the raw value
+        self.raw = {}
+        r_column = self.columns.get('r')
+        if r_column is not None:
+            residual[:, r_column] = False
+            for i, index in enumerate(indexes):
+                self.raw[i, r_column] = check_presence_advanced('r', index, context_boost=context_boost,
+                                                                term_normalized='r')
+                scores[i, r_column] = self.raw[i, r_column]
+        
+        for i, t in zip(*np.nonzero(residual)):
+            scores[i, t] = max(scores[i, t], fuzzy_word_ratio(self.terms[t], indexes[i]))
+        
+        if context_boost:
+            boosted = (scores > 0.5) & np.array([index.has_tech_context for index in indexes], dtype=bool)[:, None]
+            if r_column is not None:
+                boosted[:, r_column] = False
+            scores = np.where(boosted, np.minimum(1.0, scores + 0.1), scores)
+        self.scores = scores
+
+    def category_scores(self, terms, weight):
+        # Accumulated term by term, in the scorers' order, so the sums are
+        # bit-for-bit the ones the per-pair scorers produce
+        category_score = np.zeros(len(self.scores))
+        for _, term_normalized in terms:
+            column = self.scores[:, self.columns[term_normalized]]
+            category_score += np.where(column > 0.3, (column / len(terms)) * weight, 0.0)
+        return category_score
+
+    def matched(self, terms):
+        # Whether any of the terms scores over 0.3, per resume
+        columns = [self.columns[term_normalized] for _, term_normalized in terms]
+        return (self.scores[:, columns] > 0.3).any(axis=1)
+
+    def matches(self, terms):
+        # (resume, term position, match score) for every cell over 0.3
+        columns = [self.columns[term_normalized] for _, term_normalized in terms]
+        values = self.scores[:, columns]
+        for i, position in zip(*np.nonzero(values > 0.3)):
+            i = int(i)
+            column = columns[position]
+            yield i, int(position), self.raw.get((i, column), float(values[i, position]))
+
+def vectorized_category_scores(matrix, terms_by_category, weights, resume_count, skills=True, details=True):
+    # (score, details) per resume in the shape calculate_skills_score_advanced
+    # (or calculate_keywords_score_advanced) returns. The per-pair scorers
+    # keep integer scores until a term matches, and so does this.
+    total_scores = np.zeros(resume_count)
+    any_match = np.zeros(resume_count, dtype=bool)
+    breakdowns = [{} for _ in range(resume_count)] if details else [None] * resume_count
+    for category, weight in weights.items():
+        terms = terms_by_category[category]
+        if not terms:
+            total_scores += weight
+            if details:
+                for breakdown in breakdowns:
+                    breakdown[category] = ({'score': weight, 'matches': [], 'total_possible': weight} if skills
+                                           else {'score': weight, 'matches': []})
+            continue
+        
+        category_score = matrix.category_scores(terms, weight)
+        total_scores += category_score
+        matched = matrix.matched(terms)
+        any_match |= matched
+        if not details:
+            continue
+        
+        matches = [[] for _ in range(resume_count)]
+        for i, position, match_score in matrix.matches(terms):
+            term = terms[position][0]
+            points = (match_score / len(terms)) * weight
+            if skills:
+                matches[i].append({'skill': term, 'match_score': round(match_score, 2), 'points': points})
+            else:
+                matches[i].append({'keyword': term, 'match_score': round(match_score, 2), 'points': round(points, 2)})
+        for i, breakdown in enumerate(breakdowns):
+            breakdown[category] = {
+                'score': round(float(category_score[i]), 2) if matched[i] else 0,
+                'matches': matches[i]
+            }
+            if skills:
+                breakdown[category]['total_possible'] = weight
+    return [(float(score) if matched else int(score), breakdown)
+            for score, matched, breakdown in zip(total_scores, any_match, breakdowns)]
+
+def score_resume_rows_vectorized(resumes, jds, profiles=None, summaries=False):
+    # Same rows as score_resume_rows, with the skills and keywords scorers
+    # run once per batch over term matrices instead of once per pair
+    if profiles is None:
+        profiles = [JDProfile(jd) for jd in jds]
+    indexes = [ResumeIndex(resume_data) for resume_data in resumes]
+    # The matrices are built for the whole batch at once, so the batch
+    # shares one budget of the per-resume budget times its size
+    budget = current_scoring_budget()
+    batch_budget = scoring_budget(budget.seconds * len(resumes)) if budget is not None else nullcontext()
+    
+    skill_terms = [term_normalized for profile in profiles
+                   for terms in profile.skill_terms.values() for _, term_normalized in terms]
+    keyword_terms = [term_normalized for profile in profiles if profile.keyword_terms is not None
+                     for terms in profile.keyword_terms.values() for _, term_normalized in terms]
+    with metrics.time("term_matrix"), batch_budget as budget:
+        skills_matrix = TermMatrix([index.combined for index in indexes], skill_terms, context_boost=True)
+        keywords_matrix = TermMatrix([index.text for index in indexes], keyword_terms)
+    degraded = ("cpu_budget_exhausted",) if budget is not None and budget.skipped else ()
+    
+    rows = [[] for _ in resumes]
+    for jd, profile in zip(jds, profiles):
+        skills = vectorized_category_scores(skills_matrix, profile.skill_terms, SKILL_WEIGHTS, len(resumes),
+                                            details=not summaries)
+        if profile.keyword_terms is None:
+            keywords = [(10, {})] * len(resumes)
+        else:
+            keywords = vectorized_category_scores(keywords_matrix, profile.keyword_terms, KEYWORD_WEIGHTS,
+                                                  len(resumes), skills=False, details=not summaries)
+        score = score_resume_summary if summaries else score_resume
+        for i, (resume_data, index) in enumerate(zip(resumes, indexes)):
+            rows[i].append(score(resume_data, jd, index=index, profile=profile,
+                                 skills=skills[i], keywords=keywords[i], degraded=degraded))
+    return rows
+
+def _score_resume_chunk(args):
+    resumes, profiles, summaries, budget = args
+    with scoring_budget(budget) if budget is not None else nullcontext():
+        rows = score_resume_rows(resumes, [profile.jd for profile in profiles], profiles, summaries)
+    if summaries:
+        # Only the scores go back; the parent re-attaches its own resume/JD
+        return [[(summary.components, summary.degraded) for summary in row] for row in rows]
+    return rows
+
+class ScoringExecutor:
+    # Fans score_resume_rows out over a process pool. Work is shipped as
+    # chunks of plain resume dicts with the caller's JD profiles, so workers
+    # don't normalize the JDs again, and comes back as plain result dicts
+    # (or bare score tuples for summaries).
+    def __init__(self, max_workers=None, chunk_size=16):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.chunk_size = max(1, chunk_size)
+        self._pool = None
+
+    def _get_pool(self):
+        if self._pool is None:
+            self._pool = process_pool(self.max_workers)
+        return self._pool
+
+    def score_rows(self, resumes, jds, profiles=None, summaries=False):
+        if self.max_workers <= 1 or len(resumes) <= self.chunk_size:
+            return score_resume_rows(resumes, jds, profiles, summaries)
+        
+        if profiles is None:
+            profiles = [JDProfile(jd) for jd in jds]
+        budget = current_scoring_budget()
+        budget = budget.seconds if budget is not None else None
+        chunks = [(resumes[start:start + self.chunk_size], profiles, summaries, budget)
+                  for start in range(0, len(resumes), self.chunk_size)]
+        rows = []
+        for chunk_rows in self._get_pool().map(_score_resume_chunk, chunks):
+            rows.extend(chunk_rows)
+        if summaries:
+            rows = [[ScoreSummary(resume_data, jd, profile, components, degraded, budget)
+                     for jd, profile, (components, degraded) in zip(jds, profiles, row)]
+                    for resume_data, row in zip(resumes, rows)]
+        return rows
+
+    def shutdown(self):
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+_scoring_executor = None
+
+def get_scoring_executor():
+    global _scoring_executor
+    if _scoring_executor is None:
+        _scoring_executor = ScoringExecutor(
+            max_workers=app.config['SCORING_WORKERS'],
+            chunk_size=app.config['SCORING_CHUNK_SIZE'])
+    return _scoring_executor
+
+def score_resumes_batch(resumes, jds, top_k=None, executor=None, profiles=None, summary_only=False):
+    # Pairs are scored as summaries unless every result is returned in
+    # full, so breakdowns are only built for the ranked results that need them
+    summaries = top_k is not None or summary_only
+    if executor is None:
+        rows = score_resume_rows(resumes, jds, profiles, summaries)
+    else:
+        rows = executor.score_rows(resumes, jds, profiles, summaries)
+    
+    if summaries:
+        matrix = [[summary.total_score for summary in row] for row in rows]
+    else:
+        matrix = [[result['total_score'] for result in row] for row in rows]
+    rankings = []
+    for j, jd in enumerate(jds):
+        results = [(i, row[j]) for i, row in enumerate(rows)]
+        ranked = rank_results(results, top_k)
+        if summaries:
+            ranked = [(i, summary.to_dict(detailed=not summary_only)) for i, summary in ranked]
+        rankings.append({
+            "jd_index": j,
+            "role": jd.get('role', 'N/A'),
+            "ranked": [dict(result, resume_index=i) for i, result in ranked]
+        })
+    
+    return {"matrix": matrix, "rankings": rankings}
+
+# JD store
+class SQLiteStore:
+    # Base of the SQLite-backed stores. The database file, its directory and
+    # the schema are created on the first connection rather than at import,
+    # so importing the module writes nothing.
+    def __init__(self, path):
+        self.path = path
+        self._schema_lock = threading.Lock()
+        self._schema_ready = False
+
+    def _create_schema(self, conn):
+        raise NotImplementedError
+
+    @contextmanager
+    def _connect(self):
+        if not self._schema_ready:
+            with self._schema_lock:
+                if not self._schema_ready:
+                    directory = os.path.dirname(self.path)
+                    if directory:
+                        os.makedirs(directory, exist_ok=True)
+                    conn = sqlite3.connect(self.path, timeout=30)
+                    try:
+                        with conn:
+                            self._create_schema(conn)
+                    finally:
+                        conn.close()
+                    self._schema_ready = True
+        conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+class UnknownJDError(LookupError):
+    pass
+
+class InvalidJDError(ValueError):
+    pass
+
+# A resume that reaches every part of the experience and education scorers
+JD_PROBE_RESUME = {
+    "about": "",
+    "education": [{"degree": "B.Tech", "branch": "Computer Science"}],
+    "experience_years": 1,
+    "skills": [],
+    "projects": [],
+    "certifications": []
+}
+
+class RateLimitWaitError(TimeoutError):
+    pass
+
+class TokenBucket(SQLiteStore):
+    # Kept in SQLite, so every worker process, event loop and request thread
+    # draws from the same GROQ_REQUESTS_PER_MINUTE budget. pause() holds all
+    # callers back, e.g. for a 429's Retry-After. A rate of 0 disables the
+    # limit. A caller whose turn is more than max_wait away takes no token
+    # and gets RateLimitWaitError, so the queue never outgrows the deadline.
+    def __init__(self, path, rate, capacity):
+        super().__init__(path)
+        self.rate = rate
+        self.capacity = capacity
+
+    def _create_schema(self, conn):
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS token_bucket (
+                id INTEGER PRIMARY KEY CHECK (id = 1),
+                tokens REAL NOT NULL,
+                updated REAL NOT NULL,
+                blocked_until REAL NOT NULL
+            )
+        """)
+        conn.execute("INSERT OR IGNORE INTO token_bucket VALUES (1, ?, ?, 0)", (self.capacity, time.time()))
+
+    def reserve(self, max_wait=None):
+        # Seconds until the caller's turn, or None when that's more than
+        # max_wait away; no token is taken then
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            tokens, updated, blocked_until = conn.execute(
+                "SELECT tokens, updated, blocked_until FROM token_bucket WHERE id = 1").fetchone()
+            now = time.time()
+            blocked = max(0.0, blocked_until - now)
+            if self.rate <= 0:
+                return blocked if max_wait is None or blocked <= max_wait else None
+            tokens = min(self.capacity, tokens + max(0.0, now - updated) * self.rate) - 1
+            wait = max(-tokens / self.rate if tokens < 0 else 0.0, blocked)
+            if max_wait is not None and wait > max_wait:
+                return None
+            conn.execute("UPDATE token_bucket SET tokens = ?, updated = ? WHERE id = 1", (tokens, now))
+            return wait
+
+    def pause(self, seconds):
+        with self._connect() as conn:
+            conn.execute("UPDATE token_bucket SET blocked_until = MAX(blocked_until, ?) WHERE id = 1",
+                         (time.time() + seconds,))
+
+    def _turn(self, max_wait):
+        wait = self.reserve(None if max_wait is None else max(0.0, max_wait))
+        if wait is None:
+            metrics.inc("resume_llm_rate_limited_total")
+            raise RateLimitWaitError("Groq rate limit: no request slot within GROQ_MAX_WAIT_SECONDS")
+        return wait
+
+    async def acquire(self, max_wait=None):
+        # The SQLite lock may be contended, so it's taken off the event loop
+        wait = await asyncio.to_thread(self._turn, max_wait)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def wait(self, max_wait=None):
+        wait = self._turn(max_wait)
+        if wait > 0:
+            time.sleep(wait)
+
+groq_rate_limiter = TokenBucket(app.config['GROQ_RATE_LIMIT_PATH'],
+                                rate=app.config['GROQ_REQUESTS_PER_MINUTE'] / 60,
+                                capacity=max(1, app.config['GROQ_MAX_CONCURRENCY']))
+
+class JDStore(SQLiteStore):
+    # SQLite registry of extracted JDs. Each JD is stored under a content
+    # hash together with its serialized JDProfile, and loaded profiles are
+    # kept in memory so /analyze can score against a jd_id directly.
+    # Every add and delete is appended to jd_changes; refresh() replays the
+    # changes since the last one, so each worker's in-memory catalog of
+    # profiles follows the other workers' edits without a full reload.
+    def __init__(self, path):
+        super().__init__(path)
+        self.profiles = {}
+        self.loaded_change = 0
+        self.lock = threading.Lock()
+
+    def _create_schema(self, conn):
+        conn.execute("""CREATE TABLE IF NOT EXISTS jds (
+            id TEXT PRIMARY KEY,
+            role TEXT,
+            jd TEXT NOT NULL,
+            profile TEXT,
+            created_at TEXT NOT NULL
+        )""")
+        conn.execute("""CREATE TABLE IF NOT EXISTS jd_changes (
+            seq INTEGER PRIMARY KEY AUTOINCREMENT,
+            jd_id TEXT NOT NULL,
+            deleted INTEGER NOT NULL DEFAULT 0
+        )""")
+        # Stores created before the change log start it with their JDs
+        if conn.execute("SELECT 1 FROM jd_changes LIMIT 1").fetchone() is None:
+            conn.execute("INSERT INTO jd_changes (jd_id) SELECT id FROM jds ORDER BY created_at")
+
+    @staticmethod
+    def jd_id(jd):
+        return hashlib.sha256(json.dumps(jd, sort_keys=True).encode('utf-8')).hexdigest()[:16]
+
+    def add_many(self, jds):
+        # Every JD is profiled and scored against JD_PROBE_RESUME before any
+        # is stored, so a JD the scorer can't handle fails the whole call
+        # with InvalidJDError instead of failing every match it takes part in
+        profiles = []
+        for jd in jds:
+            try:
+                profile = JDProfile(jd)
+                score_components(JD_PROBE_RESUME, jd, profile=profile, details=False)
+                profiles.append((self.jd_id(jd), profile, json.dumps(profile.to_dict())))
+            except Exception as e:
+                raise InvalidJDError(f"JD could not be profiled for scoring: {str(e)}") from e
+        
+        with self._connect() as conn:
+            for jd_id, profile, profile_raw in profiles:
+                role = profile.jd.get('role')
+                conn.execute(
+                    "INSERT INTO jds (id, role, jd, profile, created_at) VALUES (?, ?, ?, ?, ?) "
+                    "ON CONFLICT(id) DO UPDATE SET profile = excluded.profile",
+                    (jd_id, role, json.dumps(profile.jd), profile_raw, datetime.now().isoformat()))
+                conn.execute("INSERT INTO jd_changes (jd_id) VALUES (?)", (jd_id,))
+        with self.lock:
+            for jd_id, profile, _ in profiles:
+                self.profiles[jd_id] = profile
+        return [jd_id for jd_id, _, _ in profiles]
+
+    def add(self, jd):
+        return self.add_many([jd])[0]
+
+    def refresh(self):
+        with self.lock:
+            with self._connect() as conn:
+                rows = conn.execute(
+                    "SELECT c.seq, c.jd_id, c.deleted, j.jd, j.profile FROM jd_changes c "
+                    "LEFT JOIN jds j ON j.id = c.jd_id WHERE c.seq > ? ORDER BY c.seq",
+                    (self.loaded_change,)).fetchall()
+            for seq, jd_id, deleted, jd_raw, profile_raw in rows:
+                # Re-added JDs move to the end, so the catalog keeps change order
+                self.profiles.pop(jd_id, None)
+                # Stores written before add_many() validated JDs can hold
+                # unprofiled ones; they stay out of the catalog and get()
+                # raises the scoring error for them
+                if not deleted and profile_raw is not None:
+                    self.profiles[jd_id] = JDProfile.from_dict(json.loads(jd_raw), json.loads(profile_raw))
+                self.loaded_change = seq
+
+    def catalog(self):
+        # (jd_id, JDProfile) pairs of every profiled JD, oldest first
+        self.refresh()
+        with self.lock:
+            return list(self.profiles.items())
+
+    def get(self, jd_id, refresh=True):
+        if refresh:
+            self.refresh()
+        with self.lock:
+            if jd_id in self.profiles:
+                return self.profiles[jd_id]
+        
+        with self._connect() as conn:
+            row = conn.execute("SELECT jd, profile FROM jds WHERE id = ?", (jd_id,)).fetchone()
+        if row is None:
+            raise UnknownJDError(jd_id)
+        
+        jd = json.loads(row[0])
+        profile = JDProfile.from_dict(jd, json.loads(row[1])) if row[1] else JDProfile(jd)
+        with self.lock:
+            self.profiles[jd_id] = profile
+        return profile
+
+    def list(self):
+        with self._connect() as conn:
+            rows = conn.execute("SELECT id, role, created_at FROM jds ORDER BY created_at").fetchall()
+        return [{"jd_id": jd_id, "role": role, "created_at": created_at} for jd_id, role, created_at in rows]
+
+    def delete(self, jd_id):
+        with self._connect() as conn:
+            deleted = conn.execute("DELETE FROM jds WHERE id = ?", (jd_id,)).rowcount
+            if deleted:
+                conn.execute("INSERT INTO jd_changes (jd_id, deleted) VALUES (?, 1)", (jd_id,))
+        with self.lock:
+            self.profiles.pop(jd_id, None)
+        return deleted > 0
+
+jd_store = JDStore(app.config['JD_STORE_PATH'])
+
+def resolve_jd_profiles(data):
+    if 'jd_ids' in data:
+        jd_ids = data['jd_ids'] if isinstance(data['jd_ids'], list) else [data['jd_ids']]
+        jd_store.refresh()
+        profiles = [jd_store.get(jd_id, refresh=False) for jd_id in jd_ids]
+    else:
+        jd_data = data['jd_data'] if isinstance(data['jd_data'], list) else [data['jd_data']]
+        profiles = [JDProfile(jd) for jd in jd_data]
+    return [profile.jd for profile in profiles], profiles
+
+# Resume store
+class InvalidResumeError(ValueError):
+    pass
+
+class ResumeStore(SQLiteStore):
+    # SQLite store of split_resume output with an inverted index from
+    # normalized resume tokens to resume ids. The postings live in SQLite and
+    # are mirrored in memory, catching up on rows written by any process
+    # before each shortlist; shortlist() bounds every stored resume's score
+    # from the postings and runs score_resume only on the best candidates.
+    def __init__(self, path):
+        super().__init__(path)
+        self.lock = threading.Lock()
+        self.postings = {}
+        self.profiles = {}
+        self.vocabulary = None
+        # Every token in the order it was first loaded, for fuzzy matching,
+        # and per term the tokens it fuzzy-matches, see _fuzzy_matches()
+        self.fuzzy = FuzzyWordIndex(())
+        self.fuzzy_matches = OrderedDict()
+        self.loaded_resume_id = 0
+        self.loaded_token_rowid = 0
+
+    def _create_schema(self, conn):
+        conn.execute("""CREATE TABLE IF NOT EXISTS resumes (
+            id INTEGER PRIMARY KEY,
+            content_hash TEXT UNIQUE NOT NULL,
+            candidate TEXT,
+            experience_years REAL,
+            education TEXT,
+            resume_data TEXT NOT NULL,
+            created_at TEXT NOT NULL
+        )""")
+        conn.execute("""CREATE TABLE IF NOT EXISTS resume_tokens (
+            token TEXT NOT NULL,
+            resume_id INTEGER NOT NULL
+        )""")
+        conn.execute("CREATE INDEX IF NOT EXISTS resume_tokens_token ON resume_tokens (token)")
+
+    def _load_postings(self):
+        # Loads the rows added since the last call. Writers serialize on the
+        # database, so the tokens of every resume up to the newest one read
+        # here sit below any rowid a later writer can produce.
+        with self._connect() as conn:
+            for resume_id, experience_years, education in conn.execute(
+                    "SELECT id, experience_years, education FROM resumes WHERE id > ? ORDER BY id",
+                    (self.loaded_resume_id,)):
+                # Resumes grouped by (experience, education), the inputs of
+                # the two scorers the prefilter evaluates exactly
+                key = (experience_years, tuple(map(tuple, json.loads(education))))
+                self.profiles.setdefault(key, array('I')).append(resume_id)
+                self.loaded_resume_id = resume_id
+            for rowid, token, resume_id in conn.execute(
+                    "SELECT rowid, token, resume_id FROM resume_tokens WHERE rowid > ? AND resume_id <= ? "
+                    "ORDER BY rowid", (self.loaded_token_rowid, self.loaded_resume_id)):
+                if token not in self.postings:
+                    self.postings[token] = array('I')
+                    self.vocabulary = None
+                    self.fuzzy.add(token)
+                self.postings[token].append(resume_id)
+                self.loaded_token_rowid = rowid
+        return self.postings
+
+    def add_many(self, resumes):
+        # Every resume is checked and indexed before any is stored: the
+        # prefilter scores experience and education for every stored resume,
+        # so one the scorers can't read would fail every shortlist
+        rows = []
+        for resume_data in resumes:
+            experience_years = resume_data.get('experience_years', 0)
+            education = resume_data.get('education', [])
+            if isinstance(experience_years, bool) or not isinstance(experience_years, (int, float)):
+                raise InvalidResumeError("experience_years must be a number")
+            if not isinstance(education, list) or not all(
+                    isinstance(edu, dict) and all(isinstance(edu.get(field) or '', str) for field in ('degree', 'branch'))
+                    for edu in education):
+                raise InvalidResumeError("education must be a list of objects with text degree and branch")
+            try:
+                tokens = ResumeIndex(resume_data).combined.tokens
+            except Exception as e:
+                raise InvalidResumeError(f"Resume could not be indexed for scoring: {str(e)}") from e
+            raw = json.dumps(resume_data, sort_keys=True)
+            about = resume_data.get('about') or ''
+            candidate = about.split('\n')[0].strip() if about else 'Unknown'
+            rows.append((hashlib.sha256(raw.encode('utf-8')).hexdigest(), candidate, raw, resume_data, tokens))
+        
+        resume_ids = []
+        with self.lock, self._connect() as conn:
+            for content_hash, candidate, raw, resume_data, tokens in rows:
+                existing = conn.execute("SELECT id FROM resumes WHERE content_hash = ?", (content_hash,)).fetchone()
+                if existing:
+                    resume_ids.append(existing[0])
+                    continue
+                
+                experience_years = resume_data.get('experience_years', 0)
+                education = tuple((edu.get('degree', ''), edu.get('branch', ''))
+                                  for edu in resume_data.get('education', []))
+                resume_id = conn.execute(
+                    "INSERT INTO resumes (content_hash, candidate, experience_years, education, resume_data, created_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (content_hash, candidate, experience_years, json.dumps(education), raw,
+                     datetime.now().isoformat())).lastrowid
+                conn.executemany("INSERT INTO resume_tokens (token, resume_id) VALUES (?, ?)",
+                                 [(token, resume_id) for token in tokens])
+                resume_ids.append(resume_id)
+        return resume_ids
+
+    def add(self, resume_data):
+        return self.add_many([resume_data])[0]
+
+    def get_many(self, resume_ids):
+        found = {}
+        with self._connect() as conn:
+            for start in range(0, len(resume_ids), 500):
+                chunk = resume_ids[start:start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                for resume_id, raw in conn.execute(
+                        f"SELECT id, resume_data FROM resumes WHERE id IN ({placeholders})", chunk):
+                    found[resume_id] = json.loads(raw)
+        return found
+
+    def count(self):
+        with self._connect() as conn:
+            return conn.execute("SELECT COUNT(*) FROM resumes").fetchone()[0]
+
+    def _vocabulary(self):
+        # All indexed tokens joined into one string, so finding the tokens
+        # that contain a term word is a single C-level regex scan
+        if self.vocabulary is None:
+            tokens = sorted(self.postings)
+            offsets = []
+            position = 1
+            for token in tokens:
+                offsets.append(position)
+                position += len(token) + 1
+            self.vocabulary = ("\n" + "\n".join(tokens) + "\n", offsets, tokens)
+        return self.vocabulary
+
+    def _tokens_containing(self, word):
+        # Substring semantics, like the matchers: 'java' also hits 'javascript'.
+        # For 'r', every token R_PATTERNS can match in: one holding a
+        # standalone r, or one ending in r ("r studio" after "user")
+        text, offsets, tokens = self._vocabulary()
+        matched = set()
+        if word == 'r':
+            pattern = re.compile(r'(?m)^(?:[^\n]*\br\b[^\n]*|[^\n]*r)$')
+        else:
+            pattern = re.compile(re.escape(word))
+        for match in pattern.finditer(text):
+            token = tokens[bisect.bisect_right(offsets, match.start()) - 1]
+            if token not in matched:
+                matched.add(token)
+        return matched
+
+    def _fuzzy_matches(self, term_normalized):
+        # The tokens whose SequenceMatcher ratio with the term reaches the
+        # matchers' fuzzy threshold, with that ratio. Only tokens within the
+        # FuzzyWordIndex bound are compared, and each token is compared once:
+        # a cached term only checks the tokens loaded since.
+        checked, matches = self.fuzzy_matches.pop(term_normalized, (0, {}))
+        for token, _ in self.fuzzy.bounds(term_normalized, 0.6, start=checked):
+            similarity = SequenceMatcher(None, term_normalized, token).ratio()
+            if similarity >= 0.6:
+                matches[token] = similarity
+        self.fuzzy_matches[term_normalized] = (len(self.fuzzy.words), matches)
+        while len(self.fuzzy_matches) > app.config['SHORTLIST_FUZZY_CACHE_TERMS']:
+            self.fuzzy_matches.popitem(last=False)
+        return matches
+
+    def _term_bounds(self, term_normalized, context_boost):
+        # An upper bound on check_presence_advanced() for every resume where
+        # it can count (score above 0.3), from the same rules on the resume's
+        # tokens: the term's words found in them (all of them may be the
+        # term itself, so 1.0; some give 0.7 per word), or the best fuzzy
+        # ratio with one of them, with the tech-context boost assumed. Given
+        # as (bound, posting arrays) groups, lowest bound first; a resume's
+        # bound is that of the last group it appears in.
+        def boosted(score):
+            return min(1.0, score + 0.1) if context_boost and score > 0.5 else score
+        
+        if term_normalized == 'r':
+            return [(1.0, [self.postings[token] for token in self._tokens_containing('r')])]
+        groups = [(boosted(similarity), [self.postings[token]])
+                  for token, similarity in self._fuzzy_matches(term_normalized).items()]
+        words = term_normalized.split() or [term_normalized]
+        if len(words) == 1:
+            groups.append((1.0, [self.postings[token] for token in self._tokens_containing(words[0])]))
+        else:
+            hits = Counter()
+            for word in words:
+                hits.update(set(chain.from_iterable(self.postings[token] for token in self._tokens_containing(word))))
+            by_count = {}
+            for resume_id, count in hits.items():
+                by_count.setdefault(count, array('I')).append(resume_id)
+            groups += [(1.0 if count == len(words) else boosted(count / len(words) * 0.7), [resume_ids])
+                       for count, resume_ids in by_count.items()]
+        return sorted((group for group in groups if group[0] > 0.3), key=lambda group: group[0])
+
+    def prefilter_scores(self, profile):
+        # An upper bound on every resume's score_resume total, as a constant
+        # plus a per-resume part. Skill and keyword terms are bounded by
+        # _term_bounds(); experience and education are scored exactly, once
+        # per distinct value across the store. With numpy the per-resume
+        # term bounds are summed as arrays indexed by resume id.
+        constant = 0
+        categories = [(SKILL_WEIGHTS[category], profile.skill_terms[category], True) for category in SKILL_WEIGHTS]
+        if profile.keyword_terms is None:
+            constant += sum(KEYWORD_WEIGHTS.values())
+        else:
+            categories += [(KEYWORD_WEIGHTS[category], profile.keyword_terms[category], False)
+                           for category in KEYWORD_WEIGHTS]
+        
+        if np is not None:
+            estimates = np.zeros(self.loaded_resume_id + 1)
+        else:
+            estimates = Counter()
+        for weight, terms, context_boost in categories:
+            if not terms:
+                constant += weight
+                continue
+            unit = weight / len(terms)
+            for _, term_normalized in terms:
+                groups = self._term_bounds(term_normalized, context_boost)
+                if np is not None:
+                    bounds = np.zeros(len(estimates))
+                    for bound, postings in groups:
+                        for resume_ids in postings:
+                            bounds[np.frombuffer(resume_ids, dtype=np.uintc)] = bound
+                    estimates += unit * bounds
+                else:
+                    bounds = {}
+                    for bound, postings in groups:
+                        for resume_ids in postings:
+                            bounds.update(dict.fromkeys(resume_ids, bound))
+                    estimates.update({resume_id: unit * bound for resume_id, bound in bounds.items()})
+        if np is not None:
+            estimates = estimates.tolist()
+        
+        jd_exp = profile.jd.get('experience_years', {})
+        requirements = profile.education
+        any_requirement = requirements['required_degrees'] or requirements['fields']
+        experience_scores = {}
+        degree_points = {}
+        field_points = {}
+        scores = {}
+        for (experience_years, education), resume_ids in self.profiles.items():
+            if experience_years not in experience_scores:
+                experience_scores[experience_years] = calculate_experience_score_advanced(experience_years, jd_exp)[0]
+            # Same arithmetic as calculate_education_score_advanced, with the
+            # degree and branch points memoized across the store
+            if not education:
+                education_score = 0
+            elif not any_requirement:
+                education_score = 15
+            else:
+                best = 0
+                for degree, branch in education:
+                    if degree not in degree_points:
+                        degree_points[degree] = education_degree_points(normalize_term(degree), requirements)[0]
+                    if branch not in field_points:
+                        field_points[branch] = education_field_points(TextIndex(branch), requirements)[0]
+                    best = max(best, degree_points[degree] + field_points[branch])
+                education_score = min(15, round(best, 2))
+            scores.update(dict.fromkeys(resume_ids, experience_scores[experience_years] + education_score))
+        for resume_id in scores:
+            scores[resume_id] += estimates[resume_id]
+        return constant, scores
+
+    def shortlist(self, profile, top_k=50, candidate_pool=None, summary_only=False):
+        # Scores resumes in order of their prefilter bound, top_k at a time,
+        # until the top_k-th best score reaches the bound of the next resume:
+        # no resume left can then enter the top_k, and the shortlist is
+        # exact. At most candidate_pool resumes are scored; a shortlist cut
+        # off there is returned with exact set to False.
+        with self.lock:
+            self._load_postings()
+            constant, scores = self.prefilter_scores(profile)
+        
+        candidate_pool = candidate_pool or max(top_k * 4, 100)
+        candidates = heapq.nlargest(candidate_pool + 1, scores.items(), key=lambda item: item[1])
+        summaries = []
+        best = []
+        exact = False
+        while not exact and len(summaries) < min(candidate_pool, len(candidates)):
+            batch = candidates[len(summaries):min(len(summaries) + top_k, candidate_pool)]
+            resumes = self.get_many([resume_id for resume_id, _ in batch])
+            for resume_id, _ in batch:
+                with per_resume_budget():
+                    summary = score_resume_summary(resumes[resume_id], profile.jd, profile=profile)
+                summaries.append((resume_id, summary))
+                heapq.heappush(best, summary.total_score)
+                if len(best) > top_k:
+                    heapq.heappop(best)
+            exact = len(summaries) == len(candidates) or (
+                len(best) == top_k and best[0] >= constant + candidates[len(summaries)][1])
+        
+        estimates = dict(candidates)
+        # Ties rank by resume id, as they would scoring every resume in order
+        ranked = rank_results(sorted(summaries, key=lambda item: item[0]), top_k)
+        return {
+            "ranked": [dict(summary.to_dict(detailed=not summary_only), resume_id=resume_id,
+                            prefilter_score=round(constant + estimates[resume_id], 2))
+                       for resume_id, summary in ranked],
+            "exact": exact,
+            "scored": len(summaries)
+        }
+
+resume_store = ResumeStore(app.config['RESUME_STORE_PATH'])
+
+# Background jobs
+class UnknownJobError(LookupError):
+    pass
+
+class JobQueue(SQLiteStore):
+    # Runs jobs on a thread pool in the process that accepted them and keeps
+    # their state in SQLite. A job whose process died before finishing is
+    # reported as failed the next time anyone looks it up.
+    FINISHED = ("succeeded", "failed")
+
+    def __init__(self, path, max_workers, retention_seconds):
+        super().__init__(path)
+        self.max_workers = max_workers
+        self.retention_seconds = retention_seconds
+        self.finished = threading.Condition()
+        self._executor = None
+        self._children = []
+
+    def _create_schema(self, conn):
+        conn.execute("""CREATE TABLE IF NOT EXISTS jobs (
+            id TEXT PRIMARY KEY,
+            kind TEXT NOT NULL,
+            status TEXT NOT NULL,
+            pid INTEGER NOT NULL,
+            result TEXT,
+            error TEXT,
+            created_at TEXT NOT NULL,
+            started_at TEXT,
+            finished_at TEXT,
+            finished_ts REAL,
+            progress TEXT
+        )""")
+        if 'progress' not in {row[1] for row in conn.execute("PRAGMA table_info(jobs)")}:
+            conn.execute("ALTER TABLE jobs ADD COLUMN progress TEXT")
+
+    def _get_executor(self):
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="job")
+        return self._executor
+
+    def submit(self, kind, error_message, fn, *args, progress=False):
+        # fn returns the JSON payload the synchronous route would have sent;
+        # if it raises, the job fails with "<error_message>: <exception>".
+        # With progress=True, fn also gets a progress= callback taking a
+        # JSON-serializable dict that /jobs/<id> reports while it runs.
+        job_id = self._create_row(kind)
+        self._get_executor().submit(self._run, job_id, error_message, fn, args, progress)
+        return job_id
+
+    def _create_row(self, kind):
+        job_id = uuid.uuid4().hex
+        with self._connect() as conn:
+            conn.execute("DELETE FROM jobs WHERE finished_ts < ?", (time.time() - self.retention_seconds,))
+            conn.execute("INSERT INTO jobs (id, kind, status, pid, created_at) VALUES (?, ?, 'queued', ?, ?)",
+                         (job_id, kind, os.getpid(), datetime.now().isoformat()))
+        return job_id
+
+    def submit_detached(self, kind, command, env=None, files=()):
+        # Runs the job in its own process, started as command + ["--job-id",
+        # <id>], for work that must outlive the web worker that accepted it
+        # (gunicorn recycles workers). The command calls run_detached().
+        # files are handed over to the job process, which deletes them; if
+        # it can't be started they're deleted here.
+        job_id = self._create_row(kind)
+        # Reap children that have exited so they don't linger as zombies
+        self._children = [child for child in self._children if child.poll() is None]
+        try:
+            child = subprocess.Popen(command + ["--job-id", job_id], env=env, start_new_session=True)
+        except OSError as e:
+            self._finish(job_id, "failed", error=f"Could not start job process: {str(e)}")
+            for path in files:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+            return job_id
+        self._children.append(child)
+        with self._connect() as conn:
+            conn.execute("UPDATE jobs SET pid = ? WHERE id = ? AND status = 'queued'", (child.pid, job_id))
+        return job_id
+
+    def run_detached(self, job_id, error_message, fn, *args, progress=False):
+        # The job process's side of submit_detached()
+        with self._connect() as conn:
+            conn.execute("UPDATE jobs SET pid = ? WHERE id = ?", (os.getpid(), job_id))
+        self._run(job_id, error_message, fn, args, progress)
+
+    def _report_progress(self, job_id, progress):
+        with self._connect() as conn:
+            conn.execute("UPDATE jobs SET progress = ? WHERE id = ?", (json.dumps(progress), job_id))
+
+    def _finish(self, job_id, status, result=None, error=None):
+        with self._connect() as conn:
+            conn.execute("UPDATE jobs SET status = ?, result = ?, error = ?, finished_at = ?, finished_ts = ? "
+                         "WHERE id = ? AND status NOT IN ('succeeded', 'failed')",
+                         (status, result, error, datetime.now().isoformat(), time.time(), job_id))
+        with self.finished:
+            self.finished.notify_all()
+
+    def _run(self, job_id, error_message, fn, args, progress):
+        with self._connect() as conn:
+            conn.execute("UPDATE jobs SET status = 'running', started_at = ? WHERE id = ?",
+                         (datetime.now().isoformat(), job_id))
+        kwargs = {"progress": functools.partial(self._report_progress, job_id)} if progress else {}
+        try:
+            with metrics.time(f"job_{fn.__name__}"):
+                result = fn(*args, **kwargs)
+            self._finish(job_id, "succeeded", result=json.dumps(result))
+        except Exception as e:
+            print(f"Job {job_id} failed: {e}")
+            self._finish(job_id, "failed", error=f"{error_message}: {str(e)}")
+
+    @staticmethod
+    def _process_alive(pid):
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return False
+        except PermissionError:
+            pass
+        return True
+
+    def get(self, job_id):
+        with self._connect() as conn:
+            row = conn.execute("SELECT kind, status, pid, result, error, created_at, started_at, finished_at, "
+                               "progress FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        if row is None:
+            raise UnknownJobError(job_id)
+        
+        kind, status, pid, result, error, created_at, started_at, finished_at, progress = row
+        if status not in self.FINISHED and pid != os.getpid() and not self._process_alive(pid):
+            self._finish(job_id, "failed", error="Job interrupted: its worker process exited")
+            return self.get(job_id)
+        
+        job = {
+            "job_id": job_id,
+            "kind": kind,
+            "status": status,
+            "created_at": created_at,
+            "started_at": started_at,
+            "finished_at": finished_at
+        }
+        if progress is not None:
+            job["progress"] = json.loads(progress)
+        if result is not None:
+            job["result"] = json.loads(result)
+        if error is not None:
+            job["error"] = error
+        return job
+
+    def wait(self, job_id, timeout):
+        # Long-poll: jobs of this process wake the waiter as they finish,
+        # jobs of other processes are picked up by re-reading the row
+        deadline = time.monotonic() + timeout
+        while True:
+            job = self.get(job_id)
+            remaining = deadline - time.monotonic()
+            if job["status"] in self.FINISHED or remaining <= 0:
+                return job
+            with self.finished:
+                self.finished.wait(min(remaining, 0.25))
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+job_queue = JobQueue(app.config['JOB_STORE_PATH'], app.config['JOB_WORKERS'],
+                     app.config['JOB_RETENTION_SECONDS'])
+
+# Bulk ingestion
+INGEST_EXTENSIONS = ('.pdf', '.docx')
+
+def is_ingestible(name):
+    # Skips folders and the metadata macOS adds to archives
+    basename = os.path.basename(name)
+    return (name.lower().endswith(INGEST_EXTENSIONS) and not basename.startswith('.')
+            and not name.startswith('__MACOSX/'))
+
+def oversized_file_error(size):
+    max_bytes = app.config['MAX_CONTENT_LENGTH']
+    if max_bytes and size > max_bytes:
+        return f"File is {size} bytes, over the {max_bytes} byte limit"
+    return None
+
+def list_resume_sources(source):
+    # (count, iterator of (name, bytes, error)) for the PDF/DOCX files in a
+    # ZIP archive (a path or a seekable file object) or under a directory.
+    # Files are read one at a time as the iterator advances; nothing is
+    # unpacked. Files over MAX_CONTENT_LENGTH are never read and come with
+    # an error instead of bytes; a ZIP member's declared size is enforced
+    # on decompression, so a compression bomb can't get past it.
+    if isinstance(source, str) and os.path.isdir(source):
+        paths = []
+        for root, dirs, files in os.walk(source):
+            dirs.sort()
+            paths += [os.path.join(root, filename) for filename in sorted(files)
+                      if is_ingestible(os.path.relpath(os.path.join(root, filename), source))]
+        
+        def read_paths():
+            for path in paths:
+                name = os.path.relpath(path, source)
+                error = oversized_file_error(os.path.getsize(path))
+                if error is not None:
+                    yield name, None, error
+                    continue
+                with open(path, 'rb') as file:
+                    yield name, file.read(), None
+        return len(paths), read_paths()
+    
+    archive = zipfile.ZipFile(source)
+    members = [info for info in archive.infolist() if not info.is_dir() and is_ingestible(info.filename)]
+    
+    def read_members():
+        with archive:
+            for info in members:
+                error = oversized_file_error(info.file_size)
+                if error is not None:
+                    yield info.filename, None, error
+                    continue
+                try:
+                    yield info.filename, archive.read(info), None
+                except (zipfile.BadZipFile, OSError, RuntimeError, NotImplementedError) as e:
+                    yield info.filename, None, str(e)
+    return len(members), read_members()
+
+def _ingest_entry(entry):
+    name, data = entry
+    try:
+        # Lower-cased so "CV.PDF" parses like "cv.pdf"
+        return name, extract_upload(io.BytesIO(data), name.lower(), split=True)["resume_data"], None
+    except Exception as e:
+        return name, None, str(e)
+
+def ingest_resumes(source, store=None, workers=None, batch_size=100, progress=None):
+    # Parses every resume in source with parse_doc_bytes + split_resume in a
+    # process pool and writes the results to the resume store in batches.
+    # progress, if given, is called with running counts after every batch.
+    store = store or resume_store
+    workers = workers or app.config['INGEST_WORKERS'] or os.cpu_count() or 1
+    total, entries = list_resume_sources(source)
+    report = {"total": total, "processed": 0, "ingested": 0, "failed": 0}
+    resumes = []
+    failures = []
+    pending = []
+    
+    def flush():
+        names = [name for name, _ in pending]
+        for name, resume_id in zip(names, store.add_many([resume_data for _, resume_data in pending])):
+            resumes.append({"filename": name, "resume_id": resume_id})
+        report["ingested"] += len(pending)
+        pending.clear()
+        if progress is not None:
+            progress(dict(report))
+    
+    def collect(name, resume_data, error):
+        report["processed"] += 1
+        if error is None:
+            metrics.inc("resume_ingested_files_total", outcome="ingested")
+            pending.append((name, resume_data))
+        else:
+            metrics.inc("resume_ingested_files_total", outcome="failed")
+            print(f"Failed to ingest {name}: {error}")
+            failures.append({"filename": name, "error": error})
+            report["failed"] += 1
+        if len(pending) >= batch_size:
+            flush()
+    
+    if workers <= 1:
+        for name, data, error in entries:
+            collect(*(_ingest_entry((name, data)) if error is None else (name, None, error)))
+    else:
+        # A bounded window of submitted files keeps memory flat however
+        # large the archive is
+        with process_pool(workers) as pool:
+            running = set()
+            for name, data, error in entries:
+                if error is not None:
+                    collect(name, None, error)
+                    continue
+                running.add(pool.submit(_ingest_entry, (name, data)))
+                if len(running) >= workers * 4:
+                    done, running = wait(running, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        collect(*future.result())
+            for future in running:
+                collect(*future.result())
+    flush()
+    
+    return dict(report, resumes=resumes, failures=failures)
+
+INGEST_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "scripts", "ingest_resumes.py")
+
+def process_bulk_ingestion(archive_path, progress=None):
+    # The archive is deleted by scripts/ingest_resumes.py, which owns it
+    # from the moment it starts
+    report = ingest_resumes(archive_path, progress=progress)
+    return dict(report, message="Bulk ingestion completed")
+
+# Serving lifecycle, driven by wsgi.py and gunicorn.conf.py
+def warm_up():
+    # Runs once in the server's master process before workers are forked, so
+    # every worker starts with the prompt, the JD catalog and the resume
+    # index in memory. Freezing moves them out of the garbage collector's
+    # reach, so collections in the workers don't write to (and copy) the
+    # pages they share with the master. It also creates any store that
+    # doesn't exist yet, which /ready waits for.
+    load_jd_prompt()
+    jd_store.refresh()
+    with resume_store.lock:
+        resume_store._load_postings()
+    with job_queue._connect():
+        pass
+    gc.freeze()
+
+def reset_after_fork():
+    # Process pools don't survive a fork; workers create their own on first
+    # use. The Groq rate limit needs no share per worker: its bucket lives in
+    # SQLite and every worker draws from it.
+    global _pdf_extraction_pool, _scoring_executor
+    _pdf_extraction_pool = None
+    _scoring_executor = None
+    job_queue._executor = None
+
+def readiness_checks():
+    # The prompt isn't checked: without prompt.txt the built-in default is
+    # used. The stores are opened read-only, so a missing database file
+    # fails the check instead of being created empty, and a database
+    # without its table fails the query.
+    checks = {"groq_api_key": bool(groq_api_key)}
+    for name, path, table in [("jd_store", jd_store.path, "jds"), ("resume_store", resume_store.path, "resumes"),
+                              ("job_store", job_queue.path, "jobs")]:
+        try:
+            conn = sqlite3.connect(f"file:{os.path.abspath(path)}?mode=ro", uri=True, timeout=1)
+            try:
+                conn.execute(f"SELECT 1 FROM {table} LIMIT 1").fetchall()
+            finally:
+                conn.close()
+            checks[name] = True
+        except sqlite3.Error as e:
+            print(f"Readiness check failed for {name}: {e}")
+            checks[name] = False
+    return checks
+
+# Upload and batch work shared by the synchronous routes and their jobs
+def process_jd_upload(data, filename):
+    jd_text = extract_upload(io.BytesIO(data), filename)["text"]
+    jd_data = extract_jd_info(jd_text)
+    jd_ids = jd_store.add_many(jd_data)
+    
+    return {
+        "message": "JD processed successfully",
+        "jd_data": jd_data,
+        "jd_ids": jd_ids,
+        "filename": secure_filename(filename)
+    }
+
+def process_jds_upload(uploads):
+    jd_texts = [extract_upload(io.BytesIO(data), filename)["text"] for data, filename in uploads]
+    jd_results = extract_jd_infos(jd_texts)
+    
+    results = []
+    for (_, filename), jd_data in zip(uploads, jd_results):
+        result = {"filename": secure_filename(filename), "jd_data": jd_data}
+        # One file's unusable JD doesn't fail the others
+        try:
+            result["jd_ids"] = jd_store.add_many(jd_data)
+        except InvalidJDError as e:
+            result["error"] = str(e)
+        results.append(result)
+    
+    return {
+        "message": "JDs processed successfully",
+        "results": results
+    }
+
+def process_resume_upload(data, filename):
+    resume_data = extract_upload(io.BytesIO(data), filename, split=True)["resume_data"]
+    resume_id = resume_store.add(resume_data)
+    
+    return {
+        "message": "Resume processed successfully",
+        "resume_data": resume_data,
+        "resume_id": resume_id,
+        "filename": secure_filename(filename)
+    }
+
+def process_batch_analysis(resumes, jd_data, profiles, top_k, summary_only=False):
+    with scoring_budget():
+        batch = score_resumes_batch(resumes, jd_data, top_k=top_k, executor=get_scoring_executor(),
+                                    profiles=profiles, summary_only=summary_only)
+    
+    return {
+        "message": "Batch analysis completed successfully",
+        "matrix": batch["matrix"],
+        "rankings": batch["rankings"]
+    }
+
+def analyze_pair(resume_data, jd, index, profile, summary_only):
+    # Summaries skip the skill and keyword breakdowns instead of building
+    # and then dropping them
+    if summary_only:
+        return score_resume_summary(resume_data, jd, index=index, profile=profile).to_dict(detailed=False)
+    return score_resume(resume_data, jd, index=index, profile=profile)
+
+def wants_stream(data):
+    return data.get('stream') is True or 'application/x-ndjson' in request.headers.get('Accept', '')
+
+def wants_async():
+    return request.args.get('async') in ('1', 'true') or 'respond-async' in request.headers.get('Prefer', '')
+
+def job_accepted(job_id):
+    status_url = f"/jobs/{job_id}"
+    return jsonify({
+        "message": "Job accepted",
+        "job_id": job_id,
+        "status": "queued",
+        "status_url": status_url
+    }), 202, {"Location": status_url}
+
 # Flask routes
+@app.before_request
+def start_request_timer():
+    g.request_start = time.perf_counter()
+    if app.config['ALLOW_REQUEST_PROFILING'] and request.headers.get('X-Profile') == '1':
+        g.profiler = cProfile.Profile()
+        g.profiler.enable()
+
+@app.after_request
+def record_request_metrics(response):
+    profiler = g.pop('profiler', None)
+    start = g.get('request_start', time.perf_counter())
+    endpoint = request.endpoint or 'unknown'
+    profile_path = None
+    if profiler is not None:
+        profile_path = os.path.join(app.config['PROFILE_DIR'],
+                                    f"{endpoint.replace('.', '_')}-{time.time_ns()}.prof")
+        response.headers['X-Profile-File'] = profile_path
+    
+    def record():
+        if profiler is not None:
+            profiler.disable()
+            os.makedirs(app.config['PROFILE_DIR'], exist_ok=True)
+            profiler.dump_stats(profile_path)
+        metrics.observe("resume_http_request_duration_seconds", time.perf_counter() - start, endpoint=endpoint)
+        metrics.inc("resume_http_requests_total", endpoint=endpoint, status=response.status_code)
+    
+    # A streamed response (the NDJSON results of /analyze and /match/resume)
+    # is generated after this returns, so it's timed and profiled up to the
+    # moment the server closes it
+    if response.is_streamed:
+        response.call_on_close(record)
+    else:
+        record()
+    return response
+
 @app.route('/')
 def home():
     return jsonify({"message": "Resume Relevance Check System API", "status": "active"})
@@ -526,24 +2981,42 @@ def upload_jd():
         return jsonify({"error": "No file selected"}), 400
     
     if file and (file.filename.endswith('.pdf') or file.filename.endswith('.docx')):
-        filename = secure_filename(file.filename)
-        filepath = os.path.join(app.config['UPLOAD_FOLDER'], filename)
-        file.save(filepath)
+        if wants_async():
+            return job_accepted(job_queue.submit("jd", "Error processing JD", process_jd_upload,
+                                                 file.read(), file.filename))
         
         try:
-            jd_text = parse_doc(filepath)
-            jd_data = extract_jd_info(jd_text)
-            
-            return jsonify({
-                "message": "JD processed successfully",
-                "jd_data": jd_data,
-                "filename": filename
-            })
+            return jsonify(process_jd_upload(file.read(), file.filename))
+        except InvalidJDError as e:
+            return jsonify({"error": f"Error processing JD: {str(e)}"}), 422
+        except RateLimitWaitError as e:
+            return jsonify({"error": f"Error processing JD: {str(e)}"}), 503
         except Exception as e:
             return jsonify({"error": f"Error processing JD: {str(e)}"}), 500
     else:
         return jsonify({"error": "Invalid file type. Only PDF and DOCX files are allowed."}), 400
 
+@app.route('/upload/jds', methods=['POST'])
+def upload_jds():
+    files = request.files.getlist('files')
+    if not files or all(file.filename == '' for file in files):
+        return jsonify({"error": "No files uploaded"}), 400
+    
+    for file in files:
+        if not (file.filename.endswith('.pdf') or file.filename.endswith('.docx')):
+            return jsonify({"error": f"Invalid file type for {file.filename}. Only PDF and DOCX files are allowed."}), 400
+    
+    uploads = [(file.read(), file.filename) for file in files]
+    if wants_async():
+        return job_accepted(job_queue.submit("jds", "Error processing JDs", process_jds_upload, uploads))
+    
+    try:
+        return jsonify(process_jds_upload(uploads))
+    except RateLimitWaitError as e:
+        return jsonify({"error": f"Error processing JDs: {str(e)}"}), 503
+    except Exception as e:
+        return jsonify({"error": f"Error processing JDs: {str(e)}"}), 500
+
 @app.route('/upload/resume', methods=['POST'])
 def upload_resume():
     if 'file' not in request.files:
@@ -554,19 +3027,12 @@ def upload_resume():
         return jsonify({"error": "No file selected"}), 400
     
     if file and (file.filename.endswith('.pdf') or file.filename.endswith('.docx')):
-        filename = secure_filename(file.filename)
-        filepath = os.path.join(app.config['UPLOAD_FOLDER'], filename)
-        file.save(filepath)
+        if wants_async():
+            return job_accepted(job_queue.submit("resume", "Error processing resume", process_resume_upload,
+                                                 file.read(), file.filename))
         
         try:
-            resume_text = parse_doc(filepath)
-            resume_data = split_resume(resume_text)
-            
-            return jsonify({
-                "message": "Resume processed successfully",
-                "resume_data": resume_data,
-                "filename": filename
-            })
+            return jsonify(process_resume_upload(file.read(), file.filename))
         except Exception as e:
             return jsonify({"error": f"Error processing resume: {str(e)}"}), 500
     else:
@@ -577,30 +3043,329 @@ def analyze():
     try:
         data = request.get_json()
         
-        if not data or 'resume_data' not in data or 'jd_data' not in data:
+        if not data or 'resume_data' not in data or ('jd_data' not in data and 'jd_ids' not in data):
             return jsonify({"error": "Resume data and JD data are required"}), 400
         
         resume_data = data['resume_data']
-        jd_data = data['jd_data']
+        summary_only = data.get('summary_only') is True
+        jd_data, profiles = resolve_jd_profiles(data)
+        # One CPU budget for the resume across all of its JDs
+        budget = ScoringBudget(app.config['SCORING_CPU_BUDGET'])
+        with using_scoring_budget(budget):
+            index = ResumeIndex(resume_data)
         
-        if not isinstance(jd_data, list):
-            jd_data = [jd_data]
+        if wants_stream(data):
+            # One result per line as soon as it is scored, then a closing
+            # line so clients can tell a finished stream from a cut one
+            def generate():
+                count = 0
+                try:
+                    for jd, profile in zip(jd_data, profiles):
+                        with using_scoring_budget(budget):
+                            result = analyze_pair(resume_data, jd, index, profile, summary_only)
+                        yield app.json.dumps(result) + "\n"
+                        count += 1
+                except Exception as e:
+                    yield app.json.dumps({"error": f"Error during analysis: {str(e)}"}) + "\n"
+                    return
+                yield app.json.dumps({"message": "Analysis completed successfully", "count": count}) + "\n"
+            
+            return Response(stream_with_context(generate()), mimetype='application/x-ndjson')
         
         results = []
-        for jd in jd_data:
-            result = score_resume(resume_data, jd)
-            results.append(result)
+        for jd, profile in zip(jd_data, profiles):
+            with using_scoring_budget(budget):
+                results.append(analyze_pair(resume_data, jd, index, profile, summary_only))
         
         return jsonify({
             "message": "Analysis completed successfully",
             "results": results
         })
+    except UnknownJDError as e:
+        return jsonify({"error": f"Unknown JD id: {e.args[0]}"}), 404
+    except Exception as e:
+        return jsonify({"error": f"Error during analysis: {str(e)}"}), 500
+
+@app.route('/analyze/batch', methods=['POST'])
+def analyze_batch():
+    try:
+        data = request.get_json()
+        
+        if not data or 'resume_data' not in data or ('jd_data' not in data and 'jd_ids' not in data):
+            return jsonify({"error": "Resume data and JD data are required"}), 400
+        
+        resumes = data['resume_data']
+        top_k = data.get('top_k')
+        summary_only = data.get('summary_only') is True
+        
+        if not isinstance(resumes, list):
+            resumes = [resumes]
+        if top_k is not None and (not isinstance(top_k, int) or isinstance(top_k, bool) or top_k < 1):
+            return jsonify({"error": "top_k must be a positive integer"}), 400
+        
+        jd_data, profiles = resolve_jd_profiles(data)
+        if wants_async():
+            return job_accepted(job_queue.submit("batch", "Error during batch analysis", process_batch_analysis,
+                                                 resumes, jd_data, profiles, top_k, summary_only))
+        
+        return jsonify(process_batch_analysis(resumes, jd_data, profiles, top_k, summary_only))
+    except UnknownJDError as e:
+        return jsonify({"error": f"Unknown JD id: {e.args[0]}"}), 404
+    except Exception as e:
+        return jsonify({"error": f"Error during batch analysis: {str(e)}"}), 500
+
+@app.route('/jds', methods=['GET'])
+def list_jds():
+    return jsonify({"jds": jd_store.list()})
+
+@app.route('/jds', methods=['POST'])
+def register_jds():
+    data = request.get_json()
+    if not data or 'jd_data' not in data:
+        return jsonify({"error": "JD data is required"}), 400
+    
+    jd_data = data['jd_data'] if isinstance(data['jd_data'], list) else [data['jd_data']]
+    if not all(isinstance(jd, dict) for jd in jd_data):
+        return jsonify({"error": "Each JD must be a JSON object"}), 400
+    
+    try:
+        jd_ids = jd_store.add_many(jd_data)
+    except InvalidJDError as e:
+        return jsonify({"error": str(e)}), 422
+    
+    return jsonify({
+        "message": "JDs registered successfully",
+        "jd_ids": jd_ids
+    })
+
+@app.route('/jds/<jd_id>', methods=['GET'])
+def get_jd(jd_id):
+    try:
+        return jsonify({"jd_id": jd_id, "jd_data": jd_store.get(jd_id).jd})
+    except UnknownJDError:
+        return jsonify({"error": f"Unknown JD id: {jd_id}"}), 404
+
+@app.route('/jds/<jd_id>', methods=['DELETE'])
+def delete_jd(jd_id):
+    if not jd_store.delete(jd_id):
+        return jsonify({"error": f"Unknown JD id: {jd_id}"}), 404
+    return jsonify({"message": "JD deleted", "jd_id": jd_id})
+
+@app.route('/resumes', methods=['POST'])
+def register_resumes():
+    data = request.get_json()
+    if not data or 'resume_data' not in data:
+        return jsonify({"error": "Resume data is required"}), 400
+    
+    resumes = data['resume_data'] if isinstance(data['resume_data'], list) else [data['resume_data']]
+    if not all(isinstance(resume_data, dict) for resume_data in resumes):
+        return jsonify({"error": "Each resume must be a JSON object"}), 400
+    
+    try:
+        resume_ids = resume_store.add_many(resumes)
+    except InvalidResumeError as e:
+        return jsonify({"error": str(e)}), 422
+    
+    return jsonify({
+        "message": "Resumes registered successfully",
+        "resume_ids": resume_ids
+    })
+
+@app.route('/resumes/bulk', methods=['POST'])
+def bulk_ingest_resumes():
+    # Always a background job: the archive is kept in a temporary file and
+    # ingested by scripts/ingest_resumes.py in a process of its own, so
+    # recycling or restarting web workers doesn't cut a long ingestion
+    # short. /jobs/<id> reports its progress.
+    request.max_content_length = app.config['INGEST_MAX_ARCHIVE_BYTES']
+    if 'archive' not in request.files:
+        return jsonify({"error": "No archive uploaded"}), 400
+    
+    archive = request.files['archive']
+    if not archive.filename.lower().endswith('.zip'):
+        return jsonify({"error": "Invalid file type. Only ZIP archives are allowed."}), 400
+    
+    fd, archive_path = tempfile.mkstemp(suffix='.zip')
+    with os.fdopen(fd, 'wb') as file:
+        archive.save(file)
+    if not zipfile.is_zipfile(archive_path):
+        os.remove(archive_path)
+        return jsonify({"error": "The uploaded file is not a valid ZIP archive"}), 400
+    
+    # The job process writes to this worker's stores whatever its own
+    # working directory and environment
+    env = dict(os.environ, JOB_STORE_PATH=os.path.abspath(job_queue.path),
+               RESUME_STORE_PATH=os.path.abspath(resume_store.path))
+    return job_accepted(job_queue.submit_detached("bulk_ingest", [sys.executable, INGEST_SCRIPT, archive_path],
+                                                  env=env, files=[archive_path]))
+
+@app.route('/resumes/<int:resume_id>/analysis', methods=['GET'])
+def analyze_stored_resume(resume_id):
+    # Full detailed_analysis for one shortlisted candidate against one JD
+    jd_id = request.args.get('jd_id')
+    if not jd_id:
+        return jsonify({"error": "jd_id is required"}), 400
+    
+    resume_data = resume_store.get_many([resume_id]).get(resume_id)
+    if resume_data is None:
+        return jsonify({"error": f"Unknown resume id: {resume_id}"}), 404
+    try:
+        profile = jd_store.get(jd_id)
+    except UnknownJDError:
+        return jsonify({"error": f"Unknown JD id: {jd_id}"}), 404
+    
+    try:
+        with scoring_budget():
+            result = score_resume(resume_data, profile.jd, profile=profile)
+        return jsonify(dict(result, resume_id=resume_id, jd_id=jd_id))
     except Exception as e:
         return jsonify({"error": f"Error during analysis: {str(e)}"}), 500
 
+@app.route('/match/resume', methods=['POST'])
+def match_resume():
+    # Scores one resume against every stored JD and returns the top_k roles
+    try:
+        data = request.get_json()
+        
+        if not data or 'resume_data' not in data:
+            return jsonify({"error": "Resume data is required"}), 400
+        
+        resume_data = data['resume_data']
+        top_k = data.get('top_k', 10)
+        summary_only = data.get('summary_only') is True
+        if not isinstance(top_k, int) or isinstance(top_k, bool) or top_k < 1:
+            return jsonify({"error": "top_k must be a positive integer"}), 400
+        
+        catalog = jd_store.catalog()
+        # Each JD is scored on its own, so one the scorer fails on is left
+        # out of the ranking and reported instead of failing every match. It
+        # also gets its own CPU budget, so where a JD sits in the catalog
+        # doesn't decide how much fuzzy credit it can earn.
+        summaries = []
+        skipped = []
+        with scoring_budget():
+            index = ResumeIndex(resume_data)
+            for jd_id, profile in catalog:
+                try:
+                    with per_resume_budget():
+                        summaries.append((jd_id, score_resume_summary(resume_data, profile.jd, index=index,
+                                                                      profile=profile)))
+                except Exception as e:
+                    print(f"Skipping JD {jd_id} in match: {str(e)}")
+                    skipped.append({"jd_id": jd_id, "error": str(e)})
+        # Pairs that still ran out of budget lack fuzzy credit, so they rank
+        # after every complete pair instead of against them
+        complete = [item for item in summaries if "cpu_budget_exhausted" not in item[1].degraded]
+        exhausted = [item for item in summaries if "cpu_budget_exhausted" in item[1].degraded]
+        ranked = (rank_results(complete) + rank_results(exhausted))[:top_k]
+        matches = (dict(summary.to_dict(detailed=not summary_only), jd_id=jd_id) for jd_id, summary in ranked)
+        
+        if wants_stream(data):
+            # Ranking needs every score, so lines start once scoring is done;
+            # the breakdowns are still built one line at a time
+            def generate():
+                count = 0
+                try:
+                    for match in matches:
+                        yield app.json.dumps(match) + "\n"
+                        count += 1
+                except Exception as e:
+                    yield app.json.dumps({"error": f"Error during matching: {str(e)}"}) + "\n"
+                    return
+                yield app.json.dumps({"message": "Matching completed successfully", "count": count,
+                                      "catalog_size": len(catalog), "skipped_jds": skipped}) + "\n"
+            
+            return Response(stream_with_context(generate()), mimetype='application/x-ndjson')
+        
+        return jsonify({
+            "message": "Matching completed successfully",
+            "catalog_size": len(catalog),
+            "skipped_jds": skipped,
+            "matches": list(matches)
+        })
+    except Exception as e:
+        return jsonify({"error": f"Error during matching: {str(e)}"}), 500
+
+@app.route('/shortlist', methods=['POST'])
+def shortlist():
+    try:
+        data = request.get_json()
+        
+        if not data or ('jd_data' not in data and 'jd_ids' not in data):
+            return jsonify({"error": "JD data is required"}), 400
+        
+        top_k = data.get('top_k', 50)
+        candidate_pool = data.get('candidate_pool')
+        summary_only = data.get('summary_only') is True
+        for name, value in [("top_k", top_k), ("candidate_pool", candidate_pool)]:
+            if value is not None and (not isinstance(value, int) or isinstance(value, bool) or value < 1):
+                return jsonify({"error": f"{name} must be a positive integer"}), 400
+        
+        jd_data, profiles = resolve_jd_profiles(data)
+        with scoring_budget():
+            shortlists = [
+                dict(resume_store.shortlist(profile, top_k=top_k, candidate_pool=candidate_pool,
+                                            summary_only=summary_only), role=jd.get('role', 'N/A'))
+                for jd, profile in zip(jd_data, profiles)
+            ]
+        
+        return jsonify({
+            "message": "Shortlist completed successfully",
+            "shortlists": shortlists
+        })
+    except UnknownJDError as e:
+        return jsonify({"error": f"Unknown JD id: {e.args[0]}"}), 404
+    except Exception as e:
+        return jsonify({"error": f"Error during shortlisting: {str(e)}"}), 500
+
+@app.route('/jobs/<job_id>', methods=['GET'])
+def get_job(job_id):
+    try:
+        wait = float(request.args.get('wait', 0))
+    except ValueError:
+        return jsonify({"error": "wait must be a number of seconds"}), 400
+    
+    try:
+        if wait > 0:
+            job = job_queue.wait(job_id, min(wait, app.config['JOB_MAX_WAIT_SECONDS']))
+        else:
+            job = job_queue.get(job_id)
+    except UnknownJobError:
+        return jsonify({"error": f"Unknown job id: {job_id}"}), 404
+    return jsonify(job)
+
+@app.route('/metrics', methods=['GET'])
+def metrics_endpoint():
+    gauges = []
+    for cache_name, cache in [("parse", parse_cache), ("jd_extraction", jd_extraction_cache)]:
+        stats = cache.stats()
+        for outcome in ["hits", "disk_hits", "misses"]:
+            gauges.append(("resume_cache_events_total", {"cache": cache_name, "outcome": outcome}, stats[outcome]))
+        gauges.append(("resume_cache_bytes", {"cache": cache_name}, stats["bytes"]))
+    stats = term_match_cache.stats()
+    for outcome in ["hits", "misses"]:
+        gauges.append(("resume_cache_events_total", {"cache": "term_match", "outcome": outcome}, stats[outcome]))
+    stats = normalize_term_cache_stats()
+    for outcome in ["hits", "misses"]:
+        gauges.append(("resume_cache_events_total", {"cache": "term_normalize", "outcome": outcome}, stats[outcome]))
+    return Response(metrics.render(gauges), mimetype='text/plain; version=0.0.4')
+
 @app.route('/health', methods=['GET'])
 def health_check():
-    return jsonify({"status": "healthy", "service": "Resume Relevance Check System"})
+    return jsonify({
+        "status": "healthy",
+        "service": "Resume Relevance Check System",
+        "parse_cache": parse_cache.stats(),
+        "jd_extraction_cache": jd_extraction_cache.stats(),
+        "term_match_cache": term_match_cache.stats(),
+        "term_normalize_cache": normalize_term_cache_stats()
+    })
+
+@app.route('/ready', methods=['GET'])
+def readiness_check():
+    checks = readiness_checks()
+    ready = all(checks.values())
+    return jsonify({"status": "ready" if ready else "not ready", "checks": checks}), 200 if ready else 503
 
 if __name__ == '__main__':
     app.run(host='0.0.0.0', port=9000, debug=True)
\ No newline at end of file
@@ -0,0 +1,67 @@
+# Adversarial resumes scored with the scoring guardrails off and on: split
+# time, score time and the limits each result reports as degraded. A JD
+# with an oversized skill list is scored against an ordinary resume too.
+#
+#   python benchmarks/bench_adversarial.py
+import argparse
+import random
+import string
+import time
+
+from corpus import make_jd, make_resume
+import Main_backend
+from Main_backend import TermMatchCache, app, score_resume, scoring_budget, split_resume
+
+GUARDRAILS = ["SCORING_MAX_TEXT_CHARS", "SCORING_MAX_FUZZY_WORDS", "SCORING_MAX_TERMS", "SCORING_CPU_BUDGET"]
+
+def random_word(rng, length):
+    return "".join(rng.choice(string.ascii_lowercase) for _ in range(length))
+
+def adversarial_resumes(rng):
+    return {
+        "huge skills list": "Jane Doe\nTechnical Skills\n" + ", ".join(
+            random_word(rng, rng.randint(4, 12)) for _ in range(40000)),
+        "no newlines": "Jane Doe EDUCATION B.Tech in Computer Science " + " ".join(
+            random_word(rng, rng.randint(3, 9)) for _ in range(150000)),
+        "punctuation only": "Jane Doe\nProjects\n" + "•!@$%^&*()" * 200000,
+        "very long words": "Jane Doe\nProjects\n" + " ".join(random_word(rng, 300) for _ in range(3000)),
+    }
+
+def timed(text, resume_data, jd):
+    start = time.perf_counter()
+    if resume_data is None:
+        resume_data = split_resume(text)
+    split = time.perf_counter() - start
+    # Fresh cache so every run pays for its own matching
+    Main_backend.term_match_cache = TermMatchCache(0)
+    with scoring_budget():
+        result = score_resume(resume_data, jd)
+    return split, time.perf_counter() - start - split, result
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    jd = make_jd(rng)
+    huge_jd = make_jd(rng)
+    huge_jd["must_have_skills"]["technical"] = [random_word(rng, 8) for _ in range(5000)]
+    cases = [(name, text, None, jd) for name, text in adversarial_resumes(rng).items()]
+    cases.append(("huge JD skill list", None, make_resume(rng), huge_jd))
+
+    defaults = {name: app.config[name] for name in GUARDRAILS}
+    print(f"{'':20s}{'chars':>9s}{'split':>8s}{'off':>8s}{'on':>8s}  degraded")
+    for name, text, resume_data, case_jd in cases:
+        timings = {}
+        for enabled in [False, True]:
+            for setting in GUARDRAILS:
+                app.config[setting] = defaults[setting] if enabled else 0
+            split, score, result = timed(text, resume_data, case_jd)
+            timings[enabled] = score
+        chars = len(text) if text is not None else 0
+        print(f"{name:20s}{chars:9d}{split:7.2f}s{timings[False]:7.2f}s{timings[True]:7.2f}s  "
+              f"{', '.join(result.get('degraded', [])) or '-'}")
+
+if __name__ == '__main__':
+    main()
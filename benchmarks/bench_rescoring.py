@@ -0,0 +1,54 @@
+# Re-scoring every candidate after small edits, with and without the
+# per-term match cache: one must-have skill swapped in the JD, then one
+# section (education, then projects) edited in every resume.
+#
+#   python benchmarks/bench_rescoring.py --resumes 2000
+import argparse
+import copy
+import random
+import time
+
+from corpus import SKILLS, make_jd, make_resume
+import Main_backend
+from Main_backend import TermMatchCache, app, score_resume
+
+def timed(resumes, jd):
+    start = time.perf_counter()
+    results = [score_resume(resume_data, jd) for resume_data in resumes]
+    return time.perf_counter() - start, results
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--resumes", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    resumes = [make_resume(rng) for _ in range(args.resumes)]
+    jd = make_jd(rng)
+    edited_jd = copy.deepcopy(jd)
+    technical = edited_jd["must_have_skills"]["technical"]
+    technical[0] = next(skill for skill in SKILLS if skill not in technical)
+    education_edits = [dict(resume_data, education=[dict(resume_data["education"][0], branch="Data Science")])
+                       for resume_data in resumes]
+    project_edits = [dict(resume_data, projects=resume_data["projects"] + ["built a data pipeline"])
+                     for resume_data in resumes]
+
+    steps = [("initial", resumes, jd), ("jd skill swapped", resumes, edited_jd),
+             ("education edited", education_edits, edited_jd), ("projects edited", project_edits, edited_jd)]
+    timings = {}
+    outputs = {}
+    cache_sizes = [0, app.config['TERM_MATCH_CACHE_ENTRIES']]
+    for max_entries in cache_sizes:
+        Main_backend.term_match_cache = TermMatchCache(max_entries)
+        for name, batch, batch_jd in steps:
+            timings[name, max_entries], outputs[name, max_entries] = timed(batch, batch_jd)
+
+    print(f"{'':18s}{'uncached':>10s}{'cached':>10s}")
+    for name, _, _ in steps:
+        uncached, cached = (timings[name, size] for size in cache_sizes)
+        status = "ok" if outputs[name, 0] == outputs[name, cache_sizes[1]] else "MISMATCH"
+        print(f"{name:18s}{uncached:9.2f}s{cached:9.2f}s  x{uncached / cached:5.2f}  {status}")
+
+if __name__ == '__main__':
+    main()
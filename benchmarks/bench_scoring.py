@@ -0,0 +1,57 @@
+# Serial vs process-pool throughput for batch scoring, plus the vectorized
+# engine when numpy is installed.
+#
+#   python benchmarks/bench_scoring.py --resumes 2000 --jds 10 --workers 1,4,16,32
+import argparse
+import os
+import random
+import time
+
+# The term match cache stays off so no run reuses another's matches. Pool
+# workers import Main_backend afresh, so it's turned off through the
+# environment they read their config from.
+os.environ["TERM_MATCH_CACHE_ENTRIES"] = "0"
+
+from corpus import make_jd, make_resume
+import Main_backend
+from Main_backend import ScoringExecutor, score_resume_rows, score_resume_rows_vectorized
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--resumes", type=int, default=500)
+    parser.add_argument("--jds", type=int, default=5)
+    parser.add_argument("--workers", default=f"1,{os.cpu_count() or 1}")
+    parser.add_argument("--chunk-size", type=int, default=16)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    resumes = [make_resume(rng) for _ in range(args.resumes)]
+    jds = [make_jd(rng) for _ in range(args.jds)]
+
+    start = time.perf_counter()
+    expected = score_resume_rows(resumes, jds)
+    serial = time.perf_counter() - start
+    print(f"serial      {serial:8.2f}s  {args.resumes / serial:8.1f} resumes/s")
+
+    if Main_backend.np is not None:
+        start = time.perf_counter()
+        rows = score_resume_rows_vectorized(resumes, jds)
+        elapsed = time.perf_counter() - start
+        status = "ok" if rows == expected else "MISMATCH"
+        print(f"vectorized  {elapsed:8.2f}s  {args.resumes / elapsed:8.1f} resumes/s  "
+              f"x{serial / elapsed:5.2f}  {status}")
+
+    for workers in sorted({int(w) for w in args.workers.split(",")}):
+        executor = ScoringExecutor(max_workers=workers, chunk_size=args.chunk_size)
+        executor.score_rows(resumes[:args.chunk_size * workers], jds)  # warm the pool
+        start = time.perf_counter()
+        rows = executor.score_rows(resumes, jds)
+        elapsed = time.perf_counter() - start
+        executor.shutdown()
+        status = "ok" if rows == expected else "MISMATCH"
+        print(f"workers={workers:<4}{elapsed:8.2f}s  {args.resumes / elapsed:8.1f} resumes/s  "
+              f"x{serial / elapsed:5.2f}  {status}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,86 @@
+# Shortlisting latency at scale, and how much of the exhaustive top-k the
+# prefilter keeps. Besides the corpus' skill words, each resume carries
+# --extra-words words drawn from a Zipf-distributed vocabulary of
+# --vocabulary made-up words, some of them misspelled skills, so the index
+# is as large as a real store's and fuzzy-only matches occur.
+#
+#   python benchmarks/bench_shortlist.py --resumes 100000 --top-k 50
+#   python benchmarks/bench_shortlist.py --resumes 5000 --check-recall
+import argparse
+import itertools
+import os
+import random
+import string
+import tempfile
+import time
+
+from corpus import SKILLS, make_jd, make_resume
+from Main_backend import JDProfile, ResumeStore, rank_results, score_resume
+
+def misspelled(rng, word):
+    i = rng.randrange(len(word))
+    return word[:i] + word[i + 1:] if len(word) > 3 else word + rng.choice(string.ascii_lowercase)
+
+def make_vocabulary(rng, size):
+    typos = [misspelled(rng, word) for skill in SKILLS for word in skill.split() for _ in range(2)]
+    made_up = ("".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(3, 11)))
+               for _ in range(max(0, size - len(typos))))
+    vocabulary = typos + list(made_up)
+    rng.shuffle(vocabulary)
+    return vocabulary, list(itertools.accumulate(1 / rank for rank in range(1, len(vocabulary) + 1)))
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--resumes", type=int, default=20000)
+    parser.add_argument("--jds", type=int, default=5)
+    parser.add_argument("--top-k", type=int, default=50)
+    parser.add_argument("--candidate-pool", type=int)
+    parser.add_argument("--vocabulary", type=int, default=50000, help="distinct extra words across the store")
+    parser.add_argument("--extra-words", type=int, default=150, help="extra words per resume (0 disables)")
+    parser.add_argument("--check-recall", action="store_true", help="also score every resume and compare top-k")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    resumes = [make_resume(rng) for _ in range(args.resumes)]
+    jds = [make_jd(rng) for _ in range(args.jds)]
+    if args.extra_words:
+        vocabulary, cum_weights = make_vocabulary(rng, args.vocabulary)
+        for resume_data in resumes:
+            resume_data["projects"].append(" ".join(rng.choices(vocabulary, cum_weights=cum_weights,
+                                                                k=args.extra_words)))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "resumes.sqlite3")
+        store = ResumeStore(path)
+        start = time.perf_counter()
+        for batch_start in range(0, len(resumes), 1000):
+            store.add_many(resumes[batch_start:batch_start + 1000])
+        print(f"indexed {args.resumes} resumes in {time.perf_counter() - start:.1f}s")
+
+        start = time.perf_counter()
+        store = ResumeStore(path)
+        store._load_postings()
+        print(f"loaded index from disk in {time.perf_counter() - start:.2f}s, "
+              f"{len(store.postings)} distinct tokens")
+
+        for jd in jds:
+            profile = JDProfile(jd)
+            start = time.perf_counter()
+            shortlist = store.shortlist(profile, top_k=args.top_k, candidate_pool=args.candidate_pool)
+            elapsed = time.perf_counter() - start
+            shortlisted = shortlist["ranked"]
+            line = (f"{jd['role']:<10} shortlist top {args.top_k}: {elapsed * 1000:7.1f}ms, "
+                    f"{shortlist['scored']} scored, {'exact' if shortlist['exact'] else 'approximate'}")
+
+            if args.check_recall:
+                exhaustive = rank_results([(i + 1, score_resume(resume_data, jd, profile=profile))
+                                           for i, resume_data in enumerate(resumes)], args.top_k)
+                cutoff = exhaustive[-1][1]['total_score']
+                # Ties at the cutoff make the exact top-k ambiguous, so compare scores
+                kept = sum(1 for result in shortlisted if result['total_score'] >= cutoff)
+                line += f"  recall {kept}/{len(exhaustive)}"
+            print(line)
+
+if __name__ == '__main__':
+    main()
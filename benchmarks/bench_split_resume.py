@@ -0,0 +1,84 @@
+# Header classification and education-entry extraction in split_resume:
+# the precompiled matchers against the per-line re.match loop they replaced.
+#
+#   python benchmarks/bench_split_resume.py [--corpus DIR_OF_RESUMES] [--count 500]
+import argparse
+import re
+import time
+
+from corpus import resume_texts
+from Main_backend import BLANK_LINE_RE, extract_education_entry, match_section_header, split_resume
+
+LEGACY_PATTERNS = {
+    "education": r'^\s*(education|academics?|academic\s+background|qualifications?|educational?\s+background)\s*:?\s*$',
+    "work_experience": r'^\s*(experience|employment\s+history|work\s+history|professional\s+experience|career\s+history|work\s+experience|job\s+experience|internships?)\s*:?\s*$',
+    "skills": r'^\s*(skills?|technical\s+skills?|core\s+competencies|competencies|technical\s+competencies|programming\s+skills?|technologies?)\s*:?\s*$',
+    "projects": r'^\s*(projects?|academic\s+projects?|personal\s+projects?|key\s+projects?|major\s+projects?|project\s+work)\s*:?\s*$',
+    "certifications": r'^\s*(certifications?|certificates?|courses?|training|professional\s+development|licenses?)\s*:?\s*$'
+}
+
+def legacy_match_section_header(line):
+    line_lower = line.lower().strip()
+    for section_key, pattern in LEGACY_PATTERNS.items():
+        if re.match(pattern, line_lower):
+            return section_key
+    return None
+
+def legacy_extract_education_entry(entry):
+    degree_match = re.search(r'(bachelor|master|b\.?\s*tech|m\.?\s*tech|b\.?\s*sc|m\.?\s*sc|b\.?\s*e\.?|m\.?\s*e\.?|b\.?\s*a\.?|m\.?\s*a\.?|phd|doctorate|diploma)[^,\n]*', entry, re.I)
+    branch_match = re.search(r'(computer\s+science|information\s+technology|mechanical|electrical|electronics?|civil|production|manufacturing|software|data\s+science|artificial\s+intelligence|machine\s+learning)[^,\n]*', entry, re.I)
+    cgpa_match = re.search(r'(?:cgpa|gpa|grade)?\s*:?\s*(\d+(?:\.\d+)?)\s*(?:/\s*(?:10|4))?', entry, re.I)
+    year_match = re.search(r'(?:20\d{2})\s*[-–]\s*(20\d{2})|(?:graduating|graduated)?\s*(?:in\s+)?(20\d{2})', entry, re.I)
+    
+    lines_in_entry = [line.strip() for line in entry.split('\n') if line.strip()]
+    college = ""
+    for line in lines_in_entry:
+        if any(keyword in line.lower() for keyword in ['university', 'college', 'institute', 'school', 'academy']):
+            college = line
+            break
+    if not college and lines_in_entry:
+        college = max(lines_in_entry, key=len)
+    
+    return {
+        "degree": degree_match.group(0).strip() if degree_match else "",
+        "branch": branch_match.group(0).strip() if branch_match else "",
+        "cgpa": float(cgpa_match.group(1)) if cgpa_match else None,
+        "end_year": int(year_match.group(1) or year_match.group(2)) if year_match else None,
+        "college": college
+    }
+
+def timed(fn, items, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        results = [fn(item) for item in items]
+        best = min(best, time.perf_counter() - start)
+    return best, results
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--corpus", help="directory of .txt/.pdf/.docx resumes; synthetic if omitted")
+    parser.add_argument("--count", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    texts = resume_texts(args.corpus, args.count)
+    lines = [line for text in texts for line in text.replace('\r\n', '\n').split('\n') if line.strip()]
+    entries = [entry.strip() for text in texts for entry in BLANK_LINE_RE.split(text) if entry.strip()]
+    print(f"{len(texts)} resumes, {len(lines)} lines, {len(entries)} blocks")
+
+    for label, legacy, current, items in [
+        ("header match", legacy_match_section_header, match_section_header, lines),
+        ("entry fields", legacy_extract_education_entry, extract_education_entry, entries),
+    ]:
+        legacy_time, expected = timed(legacy, items, args.repeat)
+        current_time, results = timed(current, items, args.repeat)
+        status = "ok" if results == expected else "MISMATCH"
+        print(f"{label:<14}legacy {legacy_time * 1000:8.1f}ms  compiled {current_time * 1000:8.1f}ms  "
+              f"x{legacy_time / current_time:5.2f}  {status}")
+
+    split_time, _ = timed(split_resume, texts, args.repeat)
+    print(f"split_resume  {split_time * 1000:8.1f}ms  {len(texts) / split_time:8.1f} resumes/s")
+
+if __name__ == '__main__':
+    main()
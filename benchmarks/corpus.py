@@ -0,0 +1,104 @@
+# Synthetic resumes and JDs for the benchmarks, plus a loader for a
+# directory of real resume files (.txt, .pdf or .docx).
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+# Nothing here calls Groq, but importing the backend builds the client
+os.environ.setdefault("GROQ_API_KEY", "benchmark")
+
+from Main_backend import parse_doc
+
+SKILLS = ["python", "java", "javascript", "r", "c++", "sql", "machine learning", "deep learning",
+          "react", "node.js", "aws", "docker", "kubernetes", "tensorflow", "pytorch", "excel",
+          "tableau", "git", "linux", "spring boot", "flask", "django", "nlp", "computer vision",
+          "communication", "teamwork", "leadership", "problem solving", "agile", "statistics"]
+FILLER = ["built", "designed", "a", "the", "platform", "tool", "using", "team", "system",
+          "pipeline", "service", "analysis", "deployed", "improved", "latency", "users"]
+DEGREES = ["B.Tech", "M.Tech", "Bachelor of Engineering", "Master of Science", "B.Sc", "PhD", "Diploma"]
+BRANCHES = ["Computer Science", "Information Technology", "Electronics", "Mechanical",
+            "Data Science", "Electrical", "Civil"]
+HEADERS = {
+    "education": ["EDUCATION", "Education:", "Academic Background", "Qualifications"],
+    "experience": ["Experience", "WORK EXPERIENCE", "Professional Experience", "Internships"],
+    "skills": ["Skills", "Technical Skills:", "Core Competencies", "Technologies"],
+    "projects": ["Projects", "Academic Projects", "Key Projects"],
+    "certifications": ["Certifications", "Courses", "Training"]
+}
+
+def words(rng, n):
+    return " ".join(rng.choice(SKILLS + FILLER * 3) for _ in range(n))
+
+def make_resume(rng):
+    return {
+        "about": f"Candidate {rng.randint(1, 10**6)}\n{words(rng, 40)}",
+        "education": [{"degree": rng.choice(DEGREES), "branch": rng.choice(BRANCHES), "cgpa": 8.1,
+                       "end_year": 2024, "college": "Institute of Technology"}],
+        "experience_years": rng.randint(0, 6),
+        "skills": rng.sample(SKILLS, rng.randint(3, 15)),
+        "projects": [words(rng, 30) for _ in range(rng.randint(1, 4))],
+        "certifications": []
+    }
+
+def make_resume_text(rng, allow_present=True):
+    lines = [f"Candidate {rng.randint(1, 10**6)}", "candidate@example.com | +91 98765 43210", words(rng, 30), ""]
+    
+    lines.append(rng.choice(HEADERS["education"]))
+    for _ in range(rng.randint(1, 3)):
+        start = rng.randint(2012, 2021)
+        lines += [f"{rng.choice(DEGREES)} in {rng.choice(BRANCHES)}",
+                  f"{rng.choice(['National', 'State', 'City'])} Institute of Technology",
+                  f"CGPA: {rng.uniform(6, 10):.2f}/10", f"{start} - {start + 4}", ""]
+    
+    lines.append(rng.choice(HEADERS["experience"]))
+    for _ in range(rng.randint(0, 3)):
+        start = rng.randint(2015, 2023)
+        end = str(start + rng.randint(1, 3))
+        if allow_present and rng.random() < 0.5:
+            end = "Present"
+        lines += [f"Software Engineer, Company {rng.randint(1, 500)}  {start} - {end}",
+                  *[f"• {words(rng, 14)}" for _ in range(rng.randint(2, 5))], ""]
+    
+    lines.append(rng.choice(HEADERS["skills"]))
+    lines.append(", ".join(rng.sample(SKILLS, rng.randint(4, 18))))
+    lines.append("")
+    
+    lines.append(rng.choice(HEADERS["projects"]))
+    for _ in range(rng.randint(1, 4)):
+        lines += [f"• {words(rng, 20)}"]
+    lines.append("")
+    
+    lines.append(rng.choice(HEADERS["certifications"]))
+    for _ in range(rng.randint(0, 4)):
+        lines.append(f"- {words(rng, 5)}")
+    
+    return "\n".join(lines)
+
+def make_jd(rng):
+    return {
+        "role": f"Role {rng.randint(1, 1000)}",
+        "must_have_skills": {"technical": rng.sample(SKILLS, 6), "domain": rng.sample(SKILLS, 3),
+                             "soft": ["communication", "teamwork"]},
+        "keywords": {"primary": rng.sample(SKILLS, 4), "secondary": rng.sample(SKILLS, 4)},
+        "experience_years": {"min": rng.randint(0, 3)},
+        "eligibility_criteria": {"degrees": {"required": [rng.choice(DEGREES)], "preferred": []},
+                                 "fields": [rng.choice(BRANCHES)]}
+    }
+
+def load_corpus(path):
+    texts = []
+    for name in sorted(os.listdir(path)):
+        file_path = os.path.join(path, name)
+        if name.endswith(".txt"):
+            with open(file_path, 'r', encoding='utf-8') as file:
+                texts.append(file.read())
+        elif name.endswith(".pdf") or name.endswith(".docx"):
+            texts.append(parse_doc(file_path))
+    return texts
+
+def resume_texts(corpus_path=None, count=500, seed=0):
+    if corpus_path:
+        return load_corpus(corpus_path)
+    rng = random.Random(seed)
+    return [make_resume_text(rng) for _ in range(count)]
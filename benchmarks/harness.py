@@ -0,0 +1,209 @@
+# Pipeline benchmark and golden-output check.
+#
+#   python benchmarks/harness.py                         per-stage latency and throughput
+#   python benchmarks/harness.py --save before.json      ...and keep the numbers
+#   python benchmarks/harness.py --compare before.json   flag stages slower than the saved run
+#   python benchmarks/harness.py --check-golden          scores must match benchmarks/golden/
+#   python benchmarks/harness.py --write-golden          regenerate the golden corpus
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+import fitz
+
+from corpus import make_jd, make_resume_text
+import Main_backend
+from Main_backend import (TermMatchCache, calculate_education_score_advanced, calculate_experience_score_advanced,
+                          calculate_keywords_score_advanced, calculate_skills_score_advanced,
+                          normalize_text, parse_doc_bytes, score_resume, score_resume_rows_vectorized,
+                          split_resume)
+
+GOLDEN_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "golden", "scoring.json")
+LINES_PER_PAGE = 45
+
+def make_pdf(text):
+    lines = text.split('\n')
+    with fitz.open() as doc:
+        for start in range(0, len(lines), LINES_PER_PAGE):
+            page = doc.new_page()
+            page.insert_text((50, 50), '\n'.join(lines[start:start + LINES_PER_PAGE]), fontsize=9)
+        return doc.tobytes()
+
+def percentile(samples, p):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(round(p / 100 * (len(ordered) - 1))))]
+
+def resume_blob(resume_data):
+    return normalize_text(" ".join([
+        resume_data.get('about', ''),
+        " ".join(resume_data.get('skills', [])),
+        " ".join(resume_data.get('projects', []))
+    ]))
+
+def timed(samples, fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    samples.append(time.perf_counter() - start)
+    return result
+
+def run_benchmark(resume_count, jd_count, seed):
+    rng = random.Random(seed)
+    texts = [make_resume_text(rng) for _ in range(resume_count)]
+    pdfs = [make_pdf(text) for text in texts]
+    jds = [make_jd(rng) for _ in range(jd_count)]
+    
+    stages = {name: [] for name in ["parse_doc", "split_resume", "score_resume",
+                                    "calculate_skills_score_advanced", "calculate_experience_score_advanced",
+                                    "calculate_education_score_advanced", "calculate_keywords_score_advanced"]}
+    
+    # Every run scores cold: a warm term match cache would turn the timings
+    # into cache hits
+    Main_backend.term_match_cache = TermMatchCache(0)
+    pipeline_start = time.perf_counter()
+    for pdf in pdfs:
+        text = timed(stages["parse_doc"], parse_doc_bytes, pdf, "resume.pdf")
+        resume_data = timed(stages["split_resume"], split_resume, text)
+        for jd in jds:
+            timed(stages["score_resume"], score_resume, resume_data, jd)
+    pipeline_time = time.perf_counter() - pipeline_start
+    
+    # The scorers on their own, called the way score_resume calls them
+    for text in texts:
+        resume_data = split_resume(text)
+        blob = resume_blob(resume_data)
+        for jd in jds:
+            timed(stages["calculate_skills_score_advanced"], calculate_skills_score_advanced,
+                  blob, resume_data.get('skills', []), jd['must_have_skills'])
+            timed(stages["calculate_experience_score_advanced"], calculate_experience_score_advanced,
+                  resume_data.get('experience_years', 0), jd.get('experience_years', {}))
+            timed(stages["calculate_education_score_advanced"], calculate_education_score_advanced,
+                  resume_data.get('education', []), jd.get('eligibility_criteria', {}))
+            timed(stages["calculate_keywords_score_advanced"], calculate_keywords_score_advanced,
+                  blob, jd.get('keywords', {}))
+    
+    report = {
+        "resumes": resume_count,
+        "jds": jd_count,
+        "resumes_per_sec": resume_count / pipeline_time,
+        "stages": {}
+    }
+    for name, samples in stages.items():
+        report["stages"][name] = {
+            "calls": len(samples),
+            "p50_ms": percentile(samples, 50) * 1000,
+            "p90_ms": percentile(samples, 90) * 1000,
+            "p99_ms": percentile(samples, 99) * 1000,
+            "total_ms": sum(samples) * 1000
+        }
+    return report
+
+def print_report(report, baseline=None, tolerance=0.1):
+    regressions = []
+    print(f"{report['resumes']} resumes x {report['jds']} JDs: "
+          f"{report['resumes_per_sec']:.1f} resumes/s end to end")
+    print(f"{'stage':<38}{'calls':>7}{'p50 ms':>10}{'p90 ms':>10}{'p99 ms':>10}{'total ms':>11}")
+    for name, stats in report["stages"].items():
+        line = (f"{name:<38}{stats['calls']:>7}{stats['p50_ms']:>10.3f}{stats['p90_ms']:>10.3f}"
+                f"{stats['p99_ms']:>10.3f}{stats['total_ms']:>11.1f}")
+        if baseline and name in baseline["stages"]:
+            before = baseline["stages"][name]["p50_ms"]
+            change = (stats["p50_ms"] - before) / before if before else 0.0
+            line += f"  {change:+7.1%}"
+            if change > tolerance:
+                line += "  REGRESSION"
+                regressions.append(name)
+        print(line)
+    if baseline:
+        change = report["resumes_per_sec"] / baseline["resumes_per_sec"] - 1
+        print(f"throughput {change:+.1%} vs baseline")
+        if change < -tolerance:
+            regressions.append("throughput")
+    return regressions
+
+def roundtrip(value):
+    return json.loads(json.dumps(value))
+
+def build_golden(seed, resume_count=30, jd_count=4):
+    rng = random.Random(seed)
+    # No "Present" end dates, so experience_years doesn't depend on the current year
+    texts = [make_resume_text(rng, allow_present=False) for _ in range(resume_count)]
+    jds = [make_jd(rng) for _ in range(jd_count)]
+    cases = []
+    for text in texts:
+        resume_data = split_resume(text)
+        cases.append({
+            "text": text,
+            "resume_data": resume_data,
+            "results": [score_resume(resume_data, jd) for jd in jds]
+        })
+    return roundtrip({"seed": seed, "jds": jds, "cases": cases})
+
+def check_golden(golden):
+    failures = 0
+    for i, case in enumerate(golden["cases"]):
+        resume_data = split_resume(case["text"])
+        if roundtrip(resume_data) != case["resume_data"]:
+            failures += 1
+            print(f"case {i}: split_resume output changed")
+            continue
+        for j, jd in enumerate(golden["jds"]):
+            if roundtrip(score_resume(resume_data, jd)) != case["results"][j]:
+                failures += 1
+                print(f"case {i}, jd {j}: score_resume output changed")
+    checked = len(golden["cases"]) * (1 + len(golden["jds"]))
+    
+    if Main_backend.np is not None:
+        resumes = [case["resume_data"] for case in golden["cases"]]
+        rows = score_resume_rows_vectorized(resumes, golden["jds"])
+        for i, (case, row) in enumerate(zip(golden["cases"], rows)):
+            for j, result in enumerate(row):
+                if roundtrip(result) != case["results"][j]:
+                    failures += 1
+                    print(f"case {i}, jd {j}: vectorized engine output differs")
+        checked += len(golden["cases"]) * len(golden["jds"])
+    print(f"golden: {checked - failures}/{checked} outputs identical")
+    return failures
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--resumes", type=int, default=200)
+    parser.add_argument("--jds", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--save", help="write the benchmark report to this JSON file")
+    parser.add_argument("--compare", help="compare against a report written by --save")
+    parser.add_argument("--tolerance", type=float, default=0.1, help="allowed p50 slowdown, as a fraction")
+    parser.add_argument("--check-golden", action="store_true")
+    parser.add_argument("--write-golden", action="store_true")
+    parser.add_argument("--fuzzy-mode", choices=["indexed", "compat"])
+    args = parser.parse_args()
+
+    if args.fuzzy_mode:
+        Main_backend.FUZZY_MATCH_MODE = args.fuzzy_mode
+
+    if args.write_golden:
+        os.makedirs(os.path.dirname(GOLDEN_PATH), exist_ok=True)
+        with open(GOLDEN_PATH, 'w', encoding='utf-8') as file:
+            json.dump(build_golden(args.seed), file, indent=1, sort_keys=True)
+        print(f"wrote {GOLDEN_PATH}")
+        return 0
+
+    if args.check_golden:
+        with open(GOLDEN_PATH, 'r', encoding='utf-8') as file:
+            return 1 if check_golden(json.load(file)) else 0
+
+    report = run_benchmark(args.resumes, args.jds, args.seed)
+    baseline = None
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as file:
+            baseline = json.load(file)
+    regressions = print_report(report, baseline, args.tolerance)
+    if args.save:
+        with open(args.save, 'w', encoding='utf-8') as file:
+            json.dump(report, file, indent=2)
+    return 1 if regressions else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,25 @@
+# gunicorn settings for wsgi:app. Every value can be overridden from the
+# environment, e.g. WEB_CONCURRENCY=8 GUNICORN_THREADS=2.
+import os
+
+bind = os.getenv("BIND", "0.0.0.0:9000")
+workers = int(os.getenv("WEB_CONCURRENCY", str(2 * (os.cpu_count() or 1) + 1)))
+# Threads let a worker keep serving while one request waits on Groq
+worker_class = "gthread"
+threads = int(os.getenv("GUNICORN_THREADS", "4"))
+# Import the app (and warm it) once, before forking
+preload_app = True
+# Uploads wait on LLM extraction with retries, well past gunicorn's 30s default
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "120"))
+graceful_timeout = int(os.getenv("GUNICORN_GRACEFUL_TIMEOUT", "30"))
+keepalive = 5
+# Recycle workers now and then to bound memory growth from the in-process caches
+# (bulk ingestion runs in its own process, so recycling doesn't interrupt it;
+# other ?async=1 jobs run in the worker and a recycle fails them as interrupted)
+max_requests = int(os.getenv("GUNICORN_MAX_REQUESTS", "2000"))
+max_requests_jitter = int(os.getenv("GUNICORN_MAX_REQUESTS_JITTER", "200"))
+accesslog = "-"
+
+def post_fork(server, worker):
+    import Main_backend
+    Main_backend.reset_after_fork()
@@ -0,0 +1,116 @@
+# Stand-in for the Groq chat completions API, for exercising JD extraction
+# without network access or API quota.
+#
+#   python scripts/groq_stub_server.py --port 8089 --latency 0.5 --error-rate 0.2 --rate-limit-rate 0.1
+#   GROQ_BASE_URL=http://127.0.0.1:8089 GROQ_API_KEY=stub python Main_backend.py
+import argparse
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+DEFAULT_JD = [{
+    "role": "Software Engineer",
+    "overview": "Build and maintain backend services",
+    "eligibility_criteria": {"degrees": {"required": ["B.Tech"], "preferred": []}, "fields": ["Computer Science"]},
+    "experience_years": {"min": 1, "max": 3},
+    "must_have_skills": {"technical": ["python", "sql"], "domain": ["web development"], "soft": ["communication"]},
+    "nice_to_have_skills": ["docker"],
+    "keywords": {"primary": ["backend"], "secondary": ["api"]},
+    "location": "Remote",
+    "employment_type": "Full-time"
+}]
+
+class StubState:
+    def __init__(self, args):
+        self.args = args
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+def make_handler(state):
+    class Handler(BaseHTTPRequestHandler):
+        def _send(self, status, body, headers=None):
+            payload = json.dumps(body).encode('utf-8')
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(payload)))
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def do_GET(self):
+            if self.path == '/stats':
+                with state.lock:
+                    self._send(200, {"requests": state.requests, "max_in_flight": state.max_in_flight})
+            else:
+                self._send(404, {"error": {"message": "not found"}})
+
+        def do_POST(self):
+            length = int(self.headers.get('Content-Length', 0))
+            request_body = json.loads(self.rfile.read(length) or b'{}')
+            if not self.path.endswith('/chat/completions'):
+                self._send(404, {"error": {"message": "not found"}})
+                return
+            
+            with state.lock:
+                state.requests += 1
+                state.in_flight += 1
+                state.max_in_flight = max(state.max_in_flight, state.in_flight)
+            try:
+                time.sleep(state.args.latency)
+                roll = random.random()
+                if roll < state.args.rate_limit_rate:
+                    self._send(429, {"error": {"message": "rate limited", "type": "rate_limit_exceeded"}},
+                               {"retry-after": str(state.args.retry_after)})
+                elif roll < state.args.rate_limit_rate + state.args.error_rate:
+                    self._send(500, {"error": {"message": "stub failure", "type": "internal_server_error"}})
+                else:
+                    self._send(200, {
+                        "id": f"stub-{state.requests}",
+                        "object": "chat.completion",
+                        "created": int(time.time()),
+                        "model": request_body.get("model", "stub"),
+                        "choices": [{
+                            "index": 0,
+                            "finish_reason": "stop",
+                            "message": {"role": "assistant", "content": json.dumps(state.args.jd)}
+                        }],
+                        "usage": {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0}
+                    })
+            finally:
+                with state.lock:
+                    state.in_flight -= 1
+
+        def log_message(self, format, *args):
+            if not state.args.quiet:
+                super().log_message(format, *args)
+
+    return Handler
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8089)
+    parser.add_argument("--latency", type=float, default=0.2, help="seconds to wait before answering")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of calls answered with a 500")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="fraction of calls answered with a 429")
+    parser.add_argument("--retry-after", type=float, default=1.0)
+    parser.add_argument("--response", help="JSON file with the JD array to return")
+    parser.add_argument("--quiet", action="store_true")
+    args = parser.parse_args()
+    
+    args.jd = DEFAULT_JD
+    if args.response:
+        with open(args.response, 'r', encoding='utf-8') as file:
+            args.jd = json.load(file)
+    
+    server = ThreadingHTTPServer((args.host, args.port), make_handler(StubState(args)))
+    print(f"Groq stub listening on http://{args.host}:{args.port}")
+    server.serve_forever()
+
+if __name__ == '__main__':
+    main()
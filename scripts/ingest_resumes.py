@@ -0,0 +1,59 @@
+# Bulk-load a placement drive's resumes into the resume store.
+#
+#   python scripts/ingest_resumes.py resumes.zip
+#   python scripts/ingest_resumes.py ./resumes/ --workers 8 --store resume_store.sqlite3
+#
+# POST /resumes/bulk runs it as "ingest_resumes.py <archive> --job-id <id>":
+# the archive is ingested as that background job and deleted afterwards.
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("source", help="ZIP archive or directory of PDF/DOCX resumes")
+    parser.add_argument("--workers", type=int, help="parse processes (default: INGEST_WORKERS or one per CPU)")
+    parser.add_argument("--batch-size", type=int, default=100)
+    parser.add_argument("--store", help="resume store path (default: RESUME_STORE_PATH)")
+    parser.add_argument("--job-id", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.store:
+        os.environ["RESUME_STORE_PATH"] = args.store
+
+    if args.job_id:
+        # The uploaded archive is ours to delete however far the job gets,
+        # even if it dies before the ingestion starts
+        try:
+            import Main_backend
+            Main_backend.job_queue.run_detached(args.job_id, "Error during bulk ingestion",
+                                                Main_backend.process_bulk_ingestion, args.source, progress=True)
+        finally:
+            try:
+                os.remove(args.source)
+            except OSError:
+                pass
+        return 0
+
+    import Main_backend
+
+    start = time.perf_counter()
+
+    def progress(report):
+        elapsed = time.perf_counter() - start
+        print(f"{report['processed']}/{report['total']} processed, {report['ingested']} ingested, "
+              f"{report['failed']} failed ({elapsed:.1f}s)", flush=True)
+
+    report = Main_backend.ingest_resumes(args.source, workers=args.workers, batch_size=args.batch_size,
+                                         progress=progress)
+    for failure in report["failures"]:
+        print(f"FAILED {failure['filename']}: {failure['error']}")
+    print(f"done: {report['ingested']} of {report['total']} resumes ingested into "
+          f"{Main_backend.resume_store.path}")
+    return 1 if report["failures"] else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,9 @@
+# Production entrypoint:
+#
+#   gunicorn -c gunicorn.conf.py wsgi:app
+#
+# The config preloads this module in the master process, so fitz, groq and
+# the rest of Main_backend are imported once and shared by every worker.
+from Main_backend import app, warm_up
+
+warm_up()